@@ -1,26 +1,85 @@
 # --------------------------------------------------------------------
 # 📊 ACTIVITY TRACKING: Update login and input timestamps in state file
 # --------------------------------------------------------------------
-# This module provides a single function `manage_activity_time` that:
+# This module provides:
+# - `TickContext`, a snapshot of the system probes taken once per tick
+# - `manage_activity_time`, which:
 # - Reads the current login time and idle time
 # - Compares them with previously saved timestamps
 # - Updates the state file if more recent activity is detected
+# - `get_last_activity_timestamp`, the single definition of "last activity"
 # --------------------------------------------------------------------
 
-import logging
-import os
-import sys
-from datetime import datetime
-
-# Add project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from dataclasses import dataclass
+from functools import partial
 
 from core.utils import log_info
-from core.system import is_user_logged_in, get_last_login_time
+from core.system import get_login_info
 from core.input import get_last_input_time
 
 
-def manage_activity_time(state, now, enable_logs):
+@dataclass
+class TickContext:
+    """
+    Results of the system probes (psutil, XScreenSaver) for one monitoring tick.
+
+    Built once per tick so that every consumer sees the same values and the
+    probes (login lookup, X server idle query, or an xprintidle fork when
+    libXss is unavailable) are not run more than once.
+
+    All times are POSIX timestamps in seconds.
+
+    Attributes:
+        now_ts (int): The current time for this tick.
+        is_logged_in (bool): Whether a user session is active.
+        last_login (int | None): Time of the last login.
+        last_idle (int | None): Time of the last user input.
+    """
+
+    now_ts: int
+    is_logged_in: bool
+    last_login: int | None
+    last_idle: int | None
+
+    @classmethod
+    def capture(cls, enable_logs):
+        """
+        Run the system probes and build the context for the current tick.
+
+        Args:
+            enable_logs (bool): Whether debug logs are enabled.
+
+        Returns:
+            TickContext: The probe results.
+        """
+        is_logged_in, last_login = get_login_info()
+        return cls(
+            now_ts=int(time.time()),
+            is_logged_in=is_logged_in,
+            last_login=last_login,
+            last_idle=get_last_input_time(enable_logs),
+        )
+
+
+def get_last_activity_timestamp(state):
+    """
+    Return the time of the most recent activity recorded in the state.
+
+    Activity is either a login or a keyboard/mouse input, whichever is the
+    most recent: every consumer (thresholds, metrics) uses this definition.
+
+    Args:
+        state (dict): State holding 'last_login_timestamp' and
+                      'last_input_timestamp'.
+
+    Returns:
+        int | float: POSIX timestamp of the last activity (0 if none).
+    """
+    return max(state["last_input_timestamp"], state["last_login_timestamp"])
+
+
+def manage_activity_time(state, tick, log=partial(log_info, True)):
     """
     Update the activity-related timestamps in the given state dictionary.
 
@@ -35,54 +94,41 @@ def manage_activity_time(state, now, enable_logs):
         state (dict): A dictionary containing the application's persistent state,
                       including 'last_login_timestamp', 'last_input_timestamp',
                       and additional runtime flags.
-        now (datetime.datetime): The current datetime used for context and logging.
+        tick (TickContext): System probe results for the current tick.
+        log (callable): Logger taking message parts as positional args,
+                        e.g. `partial(log_info, enable_logs)` (default: always log).
 
     Returns:
         dict: The updated state dictionary with potentially newer timestamps.
     """
 
-    # Get current login and idle times
-    last_login = get_last_login_time()
-    last_idle = get_last_input_time(enable_logs)
+    # Current login and idle times, probed once for this tick
+    last_login = tick.last_login
+    last_idle = tick.last_idle
 
     last_login_timestamp = state["last_login_timestamp"]
     last_input_timestamp = state["last_input_timestamp"]
 
-    log_info(enable_logs, f"🕒 Now: {now}")
-    log_info(enable_logs, f"🕒 last_login: {last_login}")
-    log_info(enable_logs, f"🕒 last_idle: {last_idle}")
-
-    # ⏱️ Update login timestamp if it's newer than previously saved
-    if last_login is not None:
-        login_ts = int(last_login.timestamp())
-        if login_ts > last_login_timestamp:
-            log_info(enable_logs, f"🕒 New login timestamp: {login_ts}")
-            state["last_login_timestamp"] = login_ts
-
-    # ⌨️🖱️ Update input timestamp only if a user is currently logged in
-    if is_user_logged_in():
-        log_info(enable_logs, "🟢 User is logged in. Checking input activity...")
-        if last_idle is not None:
-            idle_ts = int(last_idle.timestamp())
-            if idle_ts > last_input_timestamp:
-                log_info(enable_logs, f"🕒 New input timestamp: {idle_ts}")
-                state["last_input_timestamp"] = idle_ts
-    else:
-        # Log why input time isn't used if no user is logged in
-        if last_idle is not None:
-            log_info(
-                enable_logs,
-                "🔴 User is logged out. Input time exists but will not be used.",
-            )
-        else:
-            log_info(enable_logs, "🔴 User is logged out. No input time available.")
+    log("🕒 Now:", tick.now_ts)
+    log("🕒 last_login:", last_login)
+    log("🕒 last_idle:", last_idle)
+
+    # ⏱️ Keep the most recent login timestamp
+    login_ts = last_login if last_login else last_login_timestamp
+    state["last_login_timestamp"] = max(last_login_timestamp, login_ts)
+
+    # ⌨️🖱️ Input time only counts while a user is logged in
+    idle_ts = last_idle if tick.is_logged_in and last_idle else last_input_timestamp
+    state["last_input_timestamp"] = max(last_input_timestamp, idle_ts)
+
+    if not tick.is_logged_in:
+        log(
+            "🔴 User is logged out. Input time",
+            "exists but will not be used." if last_idle else "is not available.",
+        )
 
     # Log final timestamps
-    log_info(
-        enable_logs, f"🕒 new_last_login_timestamp: {state['last_login_timestamp']}"
-    )
-    log_info(
-        enable_logs, f"🕒 new_last_input_timestamp: {state['last_input_timestamp']}"
-    )
+    log("🕒 new_last_login_timestamp:", state["last_login_timestamp"])
+    log("🕒 new_last_input_timestamp:", state["last_input_timestamp"])
 
     return state
@@ -6,22 +6,67 @@
 # - Encrypting and saving sensitive fields (SMTP password)
 # - Validating the required fields and data types
 # --------------------------------------------------------------------
-from gi.repository import GLib
+import copy
 import os
-import json
 import subprocess
-import tempfile
+import threading
+from core import json_utils
 from core.email_utils import validate_email_address
 from core.paths import CONFIG_PATH
 
+# Parsed configuration file (password still encrypted) keyed on its mtime
+# and size; GUI worker threads and the main loop may both load it
+_CONFIG_CACHE = {"mtime": None, "size": None, "data": None}
+_CONFIG_LOCK = threading.Lock()
+
+
+def _read_config_file():
+    """
+    Return a private copy of the parsed configuration file.
+
+    The file is only re-parsed when its mtime or size changes.
+
+    Returns:
+        dict or None: The raw configuration, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(CONFIG_PATH)
+    except FileNotFoundError:
+        return None
+
+    with _CONFIG_LOCK:
+        if (st.st_mtime_ns, st.st_size) != (
+            _CONFIG_CACHE["mtime"],
+            _CONFIG_CACHE["size"],
+        ):
+            try:
+                data = json_utils.load_file(CONFIG_PATH)
+            except FileNotFoundError:  # Removed since the stat
+                return None
+            _CONFIG_CACHE.update(mtime=st.st_mtime_ns, size=st.st_size, data=data)
+
+        # Nested dicts/lists: callers edit the result (e.g. smtp_pass)
+        return copy.deepcopy(_CONFIG_CACHE["data"])
+
+
+def invalidate_config_cache():
+    """
+    Forget the cached configuration so the next load re-reads the file.
+    """
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE.update(mtime=None, size=None, data=None)
+
 
 def load_config(with_password_decryption=False):
     """
     Load the application configuration from disk (CONFIG_PATH).
 
-    If `with_password_decryption` is True, the SMTP password will be decrypted
-    using a privileged helper script. Otherwise, the password field will be returned
-    as an empty string to avoid unnecessary elevation prompts.
+    If `with_password_decryption` is True, the SMTP password will be decrypted,
+    in-process when already running as root (service, pkexec helpers) or through
+    a privileged helper script otherwise. If False, the password field will be
+    returned as an empty string to avoid unnecessary elevation prompts.
+
+    The parsed file is cached and only re-read when it changes on disk.
 
     Args:
         with_password_decryption (bool): Whether to decrypt the SMTP password (default: False).
@@ -33,13 +78,22 @@ def load_config(with_password_decryption=False):
     Raises:
         ValueError: If password decryption fails.
     """
-    if not os.path.exists(CONFIG_PATH):
+    data = _read_config_file()
+    if data is None:
         return None
 
-    with open(CONFIG_PATH, "r") as f:
-        data = json.load(f)
+    if with_password_decryption and os.geteuid() == 0:
+        # Already privileged: no need to spawn pkexec and a new interpreter
+        from core.crypto_utils import decrypt_password
 
-    if with_password_decryption:
+        try:
+            encrypted = data["email"]["smtp_pass"]
+            data["email"]["smtp_pass"] = (
+                decrypt_password(encrypted) if encrypted else ""
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt password: {e}")
+    elif with_password_decryption:
         try:
             path = os.path.join(
                 os.path.dirname(__file__), "..", "scripts", "read_password_helper.py"
@@ -65,7 +119,8 @@ def validate_config(data):
     Validate the structure and content of the configuration data.
 
     This includes checking for required fields, correct data types,
-    and valid email formats for sender and recipients.
+    and valid email formats for sender and recipients. Recipients are
+    replaced by their normalized form.
 
     Args:
         data (dict): The configuration to validate.
@@ -95,10 +150,10 @@ def validate_config(data):
     if not isinstance(email_cfg["smtp_port"], int):
         raise ValueError("smtp_port must be an integer")
 
-    # Validate sender and recipient email addresses
+    # Validate sender and recipient email addresses, keeping the normalized
+    # recipients so they don't need to be validated again when sending
     validate_email_address(email_cfg["smtp_user"])
-    for addr in email_cfg["to"]:
-        validate_email_address(addr)
+    email_cfg["to"] = [validate_email_address(addr) for addr in email_cfg["to"]]
 
     return True
 
@@ -107,10 +162,8 @@ def save_config_with_privileges(data, main_window):
     """
     Save the configuration using a privileged helper script (via pkexec).
 
-    This function:
-    - Serializes the config into a temporary file
-    - Calls a helper script with `pkexec` to save it securely
-    - Automatically deletes the temporary file afterward
+    The configuration is serialized and piped to the helper's stdin, so no
+    temporary file is written (and none can be left behind on failure).
 
     Args:
         data (dict): The configuration dictionary to save.
@@ -119,38 +172,30 @@ def save_config_with_privileges(data, main_window):
     Raises:
         RuntimeError: If saving fails or the helper script encounters an error.
     """
-    try:
-        # Write configuration to a temporary file
-        with tempfile.NamedTemporaryFile("w", delete=False) as tmp:
-            json.dump(data, tmp, indent=4)
-            tmp_path = tmp.name
-
-        helper_path = os.path.join(
-            os.path.dirname(__file__), "..", "scripts", "save_config_helper.py"
-        )
-        helper_path = os.path.abspath(helper_path)
-
-        # Run privileged helper
-        result = subprocess.run(
-            ["pkexec", "python3", helper_path, tmp_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # Forward output to GUI logs
-        # if main_window:
-        #     if result.stdout:
-        #         for line in result.stdout.strip().splitlines():
-        #             GLib.idle_add(main_window.log, line)
-        #     if result.stderr:
-        #         for line in result.stderr.strip().splitlines():
-        #             GLib.idle_add(main_window.log, line)
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to save config: {result.stderr.strip()}")
-
-    finally:
-        # Cleanup temporary file
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+    helper_path = os.path.join(
+        os.path.dirname(__file__), "..", "scripts", "save_config_helper.py"
+    )
+    helper_path = os.path.abspath(helper_path)
+
+    # Run privileged helper, streaming the config through stdin
+    result = subprocess.run(
+        ["pkexec", "python3", helper_path],
+        input=json_utils.dumps(data),
+        capture_output=True,
+    )
+
+    # Forward output to GUI logs
+    # if main_window:
+    #     if result.stdout:
+    #         for line in result.stdout.decode().strip().splitlines():
+    #             GLib.idle_add(main_window.log, line)
+    #     if result.stderr:
+    #         for line in result.stderr.decode().strip().splitlines():
+    #             GLib.idle_add(main_window.log, line)
+
+    # The helper rewrote the file (or not, on failure): don't trust the cache
+    invalidate_config_cache()
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"Failed to save config: {stderr}")
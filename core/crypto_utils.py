@@ -3,10 +3,14 @@
 # --------------------------------------------------------------------
 
 import os
-import base64
-from cryptography.fernet import Fernet, InvalidToken
 from core.paths import KEY_PATH
 
+# cryptography is imported inside the functions below: it pulls in cffi and
+# the OpenSSL bindings, which most importers of this module never need.
+
+# Cached Fernet instance, built once from KEY_PATH on first use
+_FERNET = None
+
 
 def generate_key():
     """
@@ -15,6 +19,10 @@ def generate_key():
     The directory is created if it doesn't exist, and the file's permissions
     are restricted to read/write for the owner only (chmod 600).
     """
+    global _FERNET
+
+    from cryptography.fernet import Fernet
+
     key = Fernet.generate_key()
     os.makedirs(os.path.dirname(KEY_PATH), exist_ok=True)  # Ensure parent folder exists
 
@@ -24,6 +32,9 @@ def generate_key():
     # Limit permissions to prevent unauthorized access
     os.chmod(KEY_PATH, 0o600)
 
+    # Drop any instance built from a previous key
+    _FERNET = None
+
 
 def load_key():
     """
@@ -41,6 +52,26 @@ def load_key():
         return f.read()
 
 
+def _get_fernet():
+    """
+    Return the cached Fernet instance, loading the key on first use.
+
+    Returns:
+        Fernet: A Fernet instance built from the key at KEY_PATH.
+
+    Raises:
+        FileNotFoundError: If the key file does not exist.
+    """
+    global _FERNET
+
+    # load_key() raises before assignment, so a missing key is retried next call
+    if _FERNET is None:
+        from cryptography.fernet import Fernet
+
+        _FERNET = Fernet(load_key())
+    return _FERNET
+
+
 def encrypt_password(password: str) -> str:
     """
     Encrypt a plaintext password using Fernet encryption.
@@ -51,8 +82,7 @@ def encrypt_password(password: str) -> str:
     Returns:
         str: The encrypted password as a base64 string.
     """
-    key = load_key()
-    f = Fernet(key)
+    f = _get_fernet()
     encrypted = f.encrypt(password.encode())  # Encode to bytes, then encrypt
     return encrypted.decode()  # Return as string (base64 format)
 
@@ -70,8 +100,9 @@ def decrypt_password(encrypted: str) -> str:
     Raises:
         ValueError: If the token is invalid or corrupted.
     """
-    key = load_key()
-    f = Fernet(key)
+    from cryptography.fernet import InvalidToken
+
+    f = _get_fernet()
 
     try:
         return f.decrypt(encrypted.encode()).decode()
@@ -4,19 +4,65 @@
 # This module provides:
 # - Email validation (single address or comma-separated list)
 # - Generic and test email sending via SMTP
+# - A reusable SMTP session to send several emails over one login
 # - Placeholders for monitoring-related notification functions
 # --------------------------------------------------------------------
 
-from email_validator import validate_email, EmailNotValidError
-import smtplib
+# email_validator, smtplib and email.message are imported where they are
+# used: they are only needed when validating or sending, not on every tick.
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
-from email.message import EmailMessage
+import re
+import time
+
+# Fast path for plain ASCII addresses (dot-separated atoms, hostname labels,
+# alphabetic TLD). Anything else goes through email_validator.
+_ASCII_EMAIL_RE = re.compile(
+    r"^[A-Za-z0-9_%+-]+(?:\.[A-Za-z0-9_%+-]+)*"
+    r"@((?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63})$"
+)
+
+# Domains email_validator refuses even when syntactically valid
+_SPECIAL_USE_TLDS = {"arpa", "invalid", "local", "localhost", "onion", "test"}
+
+# Port using implicit TLS (SMTPS) instead of STARTTLS
+SMTPS_PORT = 465
+
+# Minimum delay (seconds) between two messages sent over the same session,
+# so a burst (e.g. several thresholds crossed at once) stays under the
+# per-second quotas of SMTP providers
+MIN_SEND_INTERVAL = 1.25
+
+# Shared SSL context, created on first connection
+_SSL_CONTEXT = None
+
+
+def _get_ssl_context():
+    """
+    Return the shared default SSL context, creating it on first use.
+
+    Returns:
+        ssl.SSLContext: Context used for SMTPS and STARTTLS connections.
+    """
+    global _SSL_CONTEXT
+
+    if _SSL_CONTEXT is None:
+        import ssl
+
+        _SSL_CONTEXT = ssl.create_default_context()
+    return _SSL_CONTEXT
 
 
 def validate_email_address(email: str) -> str:
     """
     Validate a single email address and return its normalized form.
 
+    Only the syntax is checked (no DNS deliverability lookup), and results
+    are cached since the same few addresses are validated over and over:
+    rejected addresses are remembered too, and the same error is raised
+    again without re-running the validation.
+
     Args:
         email (str): Raw email address to validate.
 
@@ -26,8 +72,45 @@ def validate_email_address(email: str) -> str:
     Raises:
         EmailNotValidError: If the email is invalid.
     """
-    result = validate_email(email)
-    return result.email
+    normalized, error = _check_email_address(email)
+    if error is not None:
+        error_class, error_args = error
+        raise error_class(*error_args)  # Fresh instance: no stale traceback
+    return normalized
+
+
+@lru_cache(maxsize=256)
+def _check_email_address(email: str) -> tuple:
+    """
+    Cached validation backing validate_email_address().
+
+    Plain ASCII addresses are matched by a precompiled regex; other forms
+    (quoted, internationalized...) fall back to email_validator.
+
+    Args:
+        email (str): Raw email address to validate.
+
+    Returns:
+        tuple: (normalized address, None) if valid,
+               or (None, (exception class, exception args)) if not.
+    """
+    match = _ASCII_EMAIL_RE.match(email)
+    if match and len(email) <= 254 and email.index("@") <= 64:
+        domain = match.group(1).lower()
+        if (
+            domain.rsplit(".", 1)[-1] not in _SPECIAL_USE_TLDS
+            and "xn--" not in domain  # punycode is decoded by email_validator
+        ):
+            # Same normalization as email_validator: lowercase domain only
+            return email[: -len(domain)] + domain, None
+
+    from email_validator import validate_email, EmailNotValidError
+
+    try:
+        result = validate_email(email, check_deliverability=False)
+    except EmailNotValidError as e:
+        return None, (type(e), e.args)
+    return result.email, None
 
 
 def validate_recipient_list(recipient_str: str) -> list:
@@ -43,67 +126,226 @@ def validate_recipient_list(recipient_str: str) -> list:
     Raises:
         EmailNotValidError: If no valid addresses are provided.
     """
+    from email_validator import EmailNotValidError
+
     recipients = [e.strip() for e in recipient_str.split(",") if e.strip()]
     if not recipients:
         raise EmailNotValidError("No recipient email provided.")
     return [validate_email_address(e) for e in recipients]
 
 
+class SmtpSession:
+    """
+    Context manager holding a single authenticated SMTP connection.
+
+    The connection, TLS setup and login happen once, on the first message
+    sent, so several emails can be sent without paying the handshake cost
+    for each of them (and a context in which nothing gets sent costs
+    nothing). Port 465 uses implicit TLS; other ports upgrade with
+    STARTTLS.
+
+    Example:
+        with SmtpSession(config) as session:
+            send_email(config, sender, to_a, subject, body, session=session)
+            send_email(config, sender, to_b, subject, body, session=session)
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config (dict): Contains SMTP server, port, credentials.
+        """
+        self.config = config
+        self.server = None
+        self.last_send = None  # time.monotonic() of the last message sent
+        self.error = None  # Why connecting failed, if it did
+
+    def __enter__(self):
+        return self
+
+    def connect(self):
+        """
+        Open the connection, set up TLS and log in.
+
+        Raises:
+            ValueError: If no configuration is available.
+            smtplib.SMTPException | OSError: If connecting or logging in fails.
+        """
+        import smtplib
+
+        if not self.config:
+            raise ValueError("No configuration found.")
+
+        smtp_conf = self.config["email"]
+        host, port = smtp_conf["smtp_server"], smtp_conf["smtp_port"]
+        use_ssl = port == SMTPS_PORT
+
+        if use_ssl:
+            self.server = smtplib.SMTP_SSL(
+                host, port, timeout=10, context=_get_ssl_context()
+            )
+        else:
+            self.server = smtplib.SMTP(host, port, timeout=10)
+        try:
+            if not use_ssl:
+                self.server.starttls(context=_get_ssl_context())  # Enable TLS
+            self.server.login(smtp_conf["smtp_user"], smtp_conf["smtp_pass"])  # Auth
+        except Exception:
+            self.server.close()
+            self.server = None
+            raise
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except Exception:
+                self.server.close()
+            self.server = None
+        return False
+
+    def send_message(self, msg, to_addrs=None):
+        """
+        Send an already composed message over the open connection.
+
+        Args:
+            msg (EmailMessage): The message to send.
+            to_addrs (list, optional): Envelope recipients (default: msg headers).
+
+        Raises:
+            Exception: If connecting failed (now or earlier in the session)
+                       or the server rejected the message.
+        """
+        # Once the server proved unreachable, fail fast instead of waiting
+        # for another connection timeout on each remaining message
+        if self.error is not None:
+            raise self.error
+
+        if self.server is None:
+            try:
+                self.connect()
+            except Exception as e:
+                self.error = e
+                raise
+
+        # Space out consecutive messages (the first one goes out right away)
+        if self.last_send is not None:
+            wait = self.last_send + MIN_SEND_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+        self.server.send_message(msg, to_addrs=to_addrs)
+        self.last_send = time.monotonic()
+
+
 # Placeholder notification methods (to be implemented later)
+# Each accepts an optional SmtpSession shared by the caller.
 
 
-def send_weekly_email(config, settings, state):
+def send_weekly_email(config, settings, state, session=None):
     """Send notification each week."""
     logging.info("send_weekly_email")
 
 
-def send_start_reached_email(config, settings, state):
+def send_start_reached_email(config, settings, state, session=None):
     """Send notification when monitoring threshold is initially reached."""
     logging.info("send_start_reached_email")
 
 
-def send_start_disabled_email(config, settings, state):
+def send_start_disabled_email(config, settings, state, session=None):
     """Send notification if monitoring is disabled."""
     logging.info("send_start_disabled_email")
 
 
-def send_start_email(config, settings, state):
+def send_start_email(config, settings, state, session=None):
     """Send monitoring start email."""
     logging.info("send_start_email")
 
 
-def send_threshold_30_email(config, settings, state):
+def send_threshold_30_email(config, settings, state, session=None):
     """Send monitoring email at 30% of timeout threshold."""
     logging.info("send_threshold_30_email")
 
 
-def send_threshold_60_email(config, settings, state):
+def send_threshold_60_email(config, settings, state, session=None):
     """Send monitoring email at 60% of timeout threshold."""
     logging.info("send_threshold_60_email")
 
 
-def send_threshold_90_email(config, settings, state):
+def send_threshold_90_email(config, settings, state, session=None):
     """Send monitoring email at 90% of timeout threshold."""
     logging.info("send_threshold_90_email")
 
 
-def send_alert_to_recipient(config, settings, state):
-    """Send emergency alert to predefined recipients."""
+def send_alert_to_recipient(config, settings, state, session=None):
+    """
+    Send emergency alert to predefined recipients.
+
+    The whole recipient list is meant to go to send_email() at once, so
+    all recipients are delivered in a single SMTP transaction.
+    """
     logging.info("send_alert_to_recipient")
 
 
-def send_alert_to_monitoring(config, settings, state):
+def send_alert_to_monitoring(config, settings, state, session=None):
     """Send emergency alert to monitoring address."""
     logging.info("send_alert_to_monitoring")
 
 
-def send_test_email(config, settings):
+@dataclass(slots=True)
+class SendContext:
+    """
+    Everything the notification functions need, bundled once per batch.
+
+    Attributes:
+        config (Mapping): Main application config (SMTP credentials, etc.).
+        settings (Mapping): Monitoring settings.
+        state (dict): State to report in the notifications.
+    """
+
+    config: dict
+    settings: dict
+    state: dict
+
+
+def send_batch(senders, context):
+    """
+    Send several notification emails over a single SMTP session.
+
+    Failures don't stop the batch; they are reported together in a single
+    warning rather than one error per email.
+
+    Args:
+        senders (list): Notification functions (e.g. send_threshold_30_email).
+        context (SendContext): Config, settings and state passed to each one.
+    """
+    config, settings, state = context.config, context.settings, context.state
+
+    failed = []
+
+    with SmtpSession(config) as session:
+        for send in senders:
+            try:
+                if send(config, settings, state, session=session) is False:
+                    failed.append(send.__name__)
+            except Exception:
+                failed.append(send.__name__)
+
+    if failed:
+        reason = f" (SMTP unreachable: {session.error})" if session.error else ""
+        logging.warning(
+            "⚠️ %d email(s) not sent%s: %s", len(failed), reason, ", ".join(failed)
+        )
+
+
+def send_test_email(config, settings, session=None):
     """
     Send a test email using the SMTP configuration and monitoring settings.
 
     Args:
         config (dict): Main application config (SMTP credentials, etc.).
         settings (dict): Optional settings (may contain alternate recipient).
+        session (SmtpSession, optional): Open session to reuse.
 
     Returns:
         bool: True if email was sent successfully, False otherwise.
@@ -124,46 +366,56 @@ def send_test_email(config, settings):
             email_to,
             "[Inactivity Monitor][Test email]",
             "This is a test email sent from the Inactivity Monitor configuration panel.",
+            session=session,
         )
         return True
     except Exception as e:
         return False
 
 
-def send_email(config, email_from, email_to, email_subject, email_content):
+def send_email(
+    config, email_from, email_to, email_subject, email_content, session=None
+):
     """
     Send an email using the configured SMTP server.
 
+    When a session is given, the message is sent over its existing
+    connection; otherwise a one-shot connection is opened and closed.
+
     Args:
         config (dict): Contains SMTP server, port, credentials.
         email_from (str): Email sender address.
-        email_to (str): Email recipient address.
+        email_to (str | list): Recipient address, or list of addresses
+                              delivered in a single SMTP transaction.
         email_subject (str): Subject line.
         email_content (str): Plain text message body.
+        session (SmtpSession, optional): Open session to reuse.
 
     Returns:
         bool: True if email sent successfully, False otherwise.
     """
+    from email.message import EmailMessage
+
     try:
         if not config:
             raise ValueError("No configuration found.")
 
-        smtp_conf = config["email"]
+        if isinstance(email_to, str):
+            email_to = [email_to]
 
         # Compose email
         msg = EmailMessage()
         msg["Subject"] = email_subject
         msg["From"] = email_from
-        msg["To"] = email_to
+        msg["To"] = ", ".join(email_to)
         msg.set_content(email_content)
 
-        # Send via SMTP
-        with smtplib.SMTP(
-            smtp_conf["smtp_server"], smtp_conf["smtp_port"], timeout=10
-        ) as server:
-            server.starttls()  # Enable TLS
-            server.login(smtp_conf["smtp_user"], smtp_conf["smtp_pass"])  # Auth
-            server.send_message(msg)  # Send
+        # Send via SMTP, reusing the caller's session when available
+        if session is not None:
+            session.send_message(msg, to_addrs=email_to)
+        else:
+            with SmtpSession(config) as one_shot:
+                one_shot.send_message(msg, to_addrs=email_to)
 
         return True
 
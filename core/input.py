@@ -1,50 +1,156 @@
 # --------------------------------------------------------------------
-# 🖱️ INPUT MONITORING: Detect last user activity using xprintidle
+# 🖱️ INPUT MONITORING: Detect last user activity (XScreenSaver idle time)
+# --------------------------------------------------------------------
+# The idle time is read directly from the X server's MIT-SCREEN-SAVER
+# extension through ctypes (libX11 + libXss), which is what xprintidle
+# does internally, without forking a process. If the libraries or the
+# display are unavailable, the xprintidle command is used instead.
 # --------------------------------------------------------------------
 
+import ctypes
+import ctypes.util
 import subprocess
+import time
+from functools import lru_cache
 from shutil import which
-from datetime import datetime, timedelta
 import logging
 from core.utils import log_info
 
 
+class XScreenSaverInfo(ctypes.Structure):
+    """ctypes mirror of the XScreenSaverInfo struct from <X11/extensions/scrnsaver.h>."""
+
+    _fields_ = [
+        ("window", ctypes.c_ulong),
+        ("state", ctypes.c_int),
+        ("kind", ctypes.c_int),
+        ("til_or_since", ctypes.c_ulong),
+        ("idle", ctypes.c_ulong),
+        ("eventMask", ctypes.c_ulong),
+    ]
+
+
+# Loaded (libX11, libXss) pair, False if unavailable, None if not tried yet
+_XLIBS = None
+
+
+def _load_xlibs():
+    """
+    Load libX11 and libXss once and declare the functions used.
+
+    Returns:
+        tuple | None: (libX11, libXss) CDLL handles, or None if unavailable.
+    """
+    global _XLIBS
+
+    if _XLIBS is None:
+        try:
+            x11 = ctypes.CDLL(ctypes.util.find_library("X11") or "libX11.so.6")
+            xss = ctypes.CDLL(ctypes.util.find_library("Xss") or "libXss.so.1")
+
+            x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+            x11.XOpenDisplay.restype = ctypes.c_void_p
+            x11.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+            x11.XDefaultRootWindow.restype = ctypes.c_ulong
+            x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+            xss.XScreenSaverQueryInfo.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_ulong,
+                ctypes.POINTER(XScreenSaverInfo),
+            ]
+            xss.XScreenSaverQueryInfo.restype = ctypes.c_int
+
+            _XLIBS = (x11, xss)
+        except (OSError, AttributeError):
+            _XLIBS = False
+
+    return _XLIBS or None
+
+
+def get_xss_idle_ms():
+    """
+    Query the X server idle time through the XScreenSaver extension.
+
+    The display is opened for each query rather than kept open: if the X
+    server goes away (e.g. on logout), Xlib's default I/O error handler
+    would terminate the whole process on the next use of a stale connection.
+
+    Returns:
+        int | None: Idle time in milliseconds, or None if it can't be queried.
+    """
+    libs = _load_xlibs()
+    if libs is None:
+        return None
+    x11, xss = libs
+
+    display = x11.XOpenDisplay(None)  # Uses $DISPLAY / $XAUTHORITY
+    if not display:
+        return None
+
+    try:
+        info = XScreenSaverInfo()
+        root = x11.XDefaultRootWindow(display)
+        if not xss.XScreenSaverQueryInfo(display, root, ctypes.byref(info)):
+            return None
+        return info.idle
+    finally:
+        x11.XCloseDisplay(display)
+
+
+@lru_cache(maxsize=1)
 def is_xprintidle_available():
     """
     Check if the 'xprintidle' utility is available on the system.
 
+    The $PATH lookup is done once per process and the result memoized.
+
     Returns:
         bool: True if xprintidle is found in PATH, False otherwise.
     """
     return which("xprintidle") is not None
 
 
+def get_xprintidle_idle_ms():
+    """
+    Query the idle time by running the xprintidle command.
+
+    Returns:
+        int: Idle time in milliseconds.
+
+    Raises:
+        ValueError: If xprintidle returns something other than a number.
+    """
+    result = subprocess.run(["xprintidle"], capture_output=True, text=True)
+    output = result.stdout.strip()
+
+    if not output.isdigit():
+        raise ValueError(f"xprintidle returned invalid output: '{output}'")
+
+    return int(output)
+
+
 def get_last_input_time(enable_logs):
     """
-    Estimate the last user input (keyboard/mouse) using xprintidle.
+    Estimate the last user input (keyboard/mouse) from the X idle time.
 
     This function queries the idle time (in milliseconds) since the last
     user interaction, then subtracts that duration from the current time.
 
     Returns:
-        datetime | None: Timestamp of the last input, or None on error.
+        int | None: POSIX timestamp of the last input, or None on error.
     """
-    if not is_xprintidle_available():
-        log_info(enable_logs, "xprintidle not found. Idle time won't be checked.")
-        return None
+    idle_ms = get_xss_idle_ms()
 
-    try:
-        # Run xprintidle to get idle time in milliseconds
-        result = subprocess.run(["xprintidle"], capture_output=True, text=True)
-        output = result.stdout.strip()
+    if idle_ms is None:
+        if not is_xprintidle_available():
+            log_info(enable_logs, "xprintidle not found. Idle time won't be checked.")
+            return None
 
-        if not output.isdigit():
-            raise ValueError(f"xprintidle returned invalid output: '{output}'")
+        try:
+            idle_ms = get_xprintidle_idle_ms()
+        except Exception as e:
+            logging.warning(f"xprintidle error: {e}")
+            return None
 
-        idle_ms = int(output)
-        # Subtract idle time from now to get last input time
-        return datetime.now() - timedelta(milliseconds=idle_ms)
-
-    except Exception as e:
-        logging.warning(f"xprintidle error: {e}")
-        return None
+    # Subtract idle time from now to get last input time
+    return int(time.time() - idle_ms / 1000)
@@ -0,0 +1,79 @@
+# --------------------------------------------------------------------
+# 🧾 JSON UTILITIES: Fast (de)serialization with stdlib fallback
+# --------------------------------------------------------------------
+# This module wraps `orjson` when it is installed and falls back to the
+# standard `json` module otherwise (e.g. helpers run by pkexec with the
+# system interpreter). Both helpers work with bytes.
+# --------------------------------------------------------------------
+
+import json
+import mmap
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data (bytes | str): The raw JSON document.
+
+    Returns:
+        Any: The decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path):
+    """
+    Parse a JSON file by memory-mapping it instead of copying it into a buffer.
+
+    Args:
+        path (str): Path of the JSON file to read.
+
+    Returns:
+        Any: The decoded Python object.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file does not contain valid JSON.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let the parser report the error
+            return loads(f.read())
+
+        with mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
+
+
+def dumps(obj, sort_keys=False) -> bytes:
+    """
+    Serialize an object to indented JSON bytes.
+
+    Args:
+        obj: The object to serialize.
+        sort_keys (bool): Sort dictionary keys for a stable output.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+
+    # Same layout as orjson, so the output doesn't depend on the writer
+    return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False).encode()
@@ -21,3 +21,7 @@ GUI_LOG_PATH = os.path.expanduser("~/.config/inactivity-monitor/gui.log")
 
 # Path to the settings file (JSON)
 SETTINGS_PATH = "/etc/inactivity-monitor/settings.json"
+
+# Path to the metrics file (Prometheus text format) rewritten by the service
+# each tick, e.g. for node-exporter's textfile collector
+METRICS_PATH = "/run/inactivity-monitor/metrics.prom"
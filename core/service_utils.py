@@ -1,22 +1,27 @@
 # --------------------------------------------------------------------
 # ⚙️ SERVICE UTILS: Helpers to control the systemd service
 # --------------------------------------------------------------------
-# This module provides a unified function to:
+# This module provides unified functions to:
 # - Start, stop, or restart the systemd service via a privileged script
+# - Run several such commands under a single privilege elevation
 # - Use `pkexec` to trigger a helper script with root access
 # --------------------------------------------------------------------
 
 import subprocess
 import os
 
+# systemctl actions exposed to the GUI
+SERVICE_COMMANDS = frozenset({"start", "stop", "restart"})
+
+# Everything the privileged helper accepts
+HELPER_COMMANDS = SERVICE_COMMANDS | {"reset-flags"}
+
 
 def run_service_command(command: str) -> str:
     """
     Run a systemd command (start, stop, restart) through a privileged helper script.
 
-    This function delegates service control to a Python helper script
-    (scripts/control_service_helper.py) and uses `pkexec` to request
-    elevated privileges.
+    Thin wrapper around run_service_commands() for a single command.
 
     Args:
         command (str): One of "start", "stop", or "restart".
@@ -28,9 +33,37 @@ def run_service_command(command: str) -> str:
         ValueError: If the command is not supported.
         RuntimeError: If the helper script fails or is missing.
     """
-    if command not in ["start", "stop", "restart"]:
+    if command not in SERVICE_COMMANDS:
         raise ValueError(f"Unsupported command: {command}")
 
+    return run_service_commands([command])
+
+
+def run_service_commands(commands: list) -> str:
+    """
+    Run several service commands, in order, through one privileged helper call.
+
+    This function delegates service control to a Python helper script
+    (scripts/control_service_helper.py) and uses `pkexec` to request
+    elevated privileges, so the user authenticates once for the whole batch.
+
+    Args:
+        commands (list): Commands among "start", "stop", "restart"
+                         and "reset-flags" (clear the monitoring flags).
+
+    Returns:
+        str: The stdout messages returned by the helper script.
+
+    Raises:
+        ValueError: If a command is not supported or the list is empty.
+        RuntimeError: If the helper script fails or is missing.
+    """
+    if not commands:
+        raise ValueError("No service command given")
+    for command in commands:
+        if command not in HELPER_COMMANDS:
+            raise ValueError(f"Unsupported command: {command}")
+
     # Compute absolute path to the helper script
     helper_path = os.path.join(
         os.path.dirname(__file__), "..", "scripts", "control_service_helper.py"
@@ -41,7 +74,7 @@ def run_service_command(command: str) -> str:
 
     try:
         result = subprocess.run(
-            ["pkexec", "python3", helper_path, command],
+            ["pkexec", "python3", helper_path, *commands],
             check=True,
             capture_output=True,
             text=True,
@@ -6,14 +6,13 @@
 # - Validating optional fields (e.g. custom monitoring sender email)
 # - Saving settings with elevated privileges via a helper script
 # --------------------------------------------------------------------
-from gi.repository import GLib
 import os
-import json
 import tempfile
+import threading
 import subprocess
 from core.paths import SETTINGS_PATH
 from core.email_utils import validate_email_address
-from email_validator import EmailNotValidError
+from core import json_utils
 
 # Default settings used if no file is found or keys are missing
 DEFAULT_SETTINGS = {
@@ -27,23 +26,65 @@ DEFAULT_SETTINGS = {
     "weekly_monitoring_enabled": False,
     "weekly_monitoring_day": 0,
     "weekly_monitoring_hour": 12,
+    "poll_interval_seconds": 30,
 }
 
+# Accepted range (seconds) for the service's poll interval
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 3600
+
+# Settings the monitoring service reads when it starts (it doesn't reload
+# them), so changing any of these requires restarting it
+SERVICE_SETTINGS_KEYS = frozenset(
+    {
+        "enable_logs",
+        "send_monitoring_on_start",
+        "monitoring_sender",
+        "monitoring_at_30",
+        "monitoring_at_60",
+        "monitoring_at_90",
+        "monitoring_weekly_enabled",
+        "monitoring_weekly_day",
+        "monitoring_weekly_hour",
+        "poll_interval_seconds",
+    }
+)
+
+# Parsed settings keyed on the file's mtime and size (GUI worker threads
+# and the main loop may both load settings, hence the lock)
+_SETTINGS_CACHE = {"mtime": None, "size": None, "data": None}
+_SETTINGS_LOCK = threading.Lock()
+
 
 def load_settings():
     """
     Load user settings from disk or return default values if file is missing.
 
+    The parsed file is cached and only re-read when its mtime or size changes.
+
     Returns:
         dict: Complete settings dictionary with defaults merged in.
     """
-    if not os.path.exists(SETTINGS_PATH):
+    try:
+        st = os.stat(SETTINGS_PATH)
+    except FileNotFoundError:
         return DEFAULT_SETTINGS.copy()
 
-    with open(SETTINGS_PATH, "r") as f:
-        data = json.load(f)
+    with _SETTINGS_LOCK:
+        if (st.st_mtime_ns, st.st_size) == (
+            _SETTINGS_CACHE["mtime"],
+            _SETTINGS_CACHE["size"],
+        ):
+            return dict(_SETTINGS_CACHE["data"])
 
-    return {**DEFAULT_SETTINGS, **data}  # Merge user-defined with defaults
+        try:
+            data = json_utils.load_file(SETTINGS_PATH)
+        except FileNotFoundError:  # Removed since the stat
+            return DEFAULT_SETTINGS.copy()
+
+        settings = {**DEFAULT_SETTINGS, **data}  # Merge user-defined with defaults
+        _SETTINGS_CACHE.update(mtime=st.st_mtime_ns, size=st.st_size, data=settings)
+        return dict(settings)
 
 
 def validate_settings(settings: dict):
@@ -51,14 +92,18 @@ def validate_settings(settings: dict):
     Validate the structure and content of the user settings.
 
     This ensures the optional monitoring email (monitoring_sender)
-    is either empty or a valid email address.
+    is either empty or a valid email address, and that the poll interval
+    (if given) is a whole number of seconds within the accepted range.
 
     Args:
         settings (dict): The settings dictionary to validate.
 
     Raises:
-        ValueError: If the monitoring_sender is not a valid email address.
+        ValueError: If the monitoring_sender is not a valid email address,
+                    or the poll interval is invalid.
     """
+    from email_validator import EmailNotValidError
+
     email = settings.get("monitoring_sender", "").strip()
 
     if email:  # Only validate if not empty
@@ -67,11 +112,59 @@ def validate_settings(settings: dict):
         except EmailNotValidError as e:
             raise ValueError(f"Invalid monitoring sender email: {e}")
 
+    interval = settings.get(
+        "poll_interval_seconds", DEFAULT_SETTINGS["poll_interval_seconds"]
+    )
+    if not is_valid_poll_interval(interval):
+        raise ValueError(
+            f"Poll interval must be a whole number of seconds between "
+            f"{MIN_POLL_INTERVAL} and {MAX_POLL_INTERVAL}."
+        )
+
+
+def is_valid_poll_interval(value) -> bool:
+    """
+    Check that a poll interval is an int within the accepted range.
+
+    Args:
+        value: Value of the poll_interval_seconds setting.
+
+    Returns:
+        bool: True if it's a valid number of seconds.
+    """
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and MIN_POLL_INTERVAL <= value <= MAX_POLL_INTERVAL
+    )
+
+
+def settings_unchanged(settings: dict) -> bool:
+    """
+    Tell whether the settings file already holds exactly these settings.
+
+    Args:
+        settings (dict): The settings about to be saved.
+
+    Returns:
+        bool: True if saving them would not change anything on disk.
+    """
+    if not os.path.exists(SETTINGS_PATH):
+        return False
+
+    try:
+        return load_settings() == {**DEFAULT_SETTINGS, **settings}
+    except (OSError, ValueError):
+        return False  # Unreadable/corrupt file: it needs to be rewritten
+
 
 def save_settings_with_privileges(settings: dict, main_window=None):
     """
     Save the settings dictionary to disk using elevated privileges (via pkexec).
 
+    Nothing is written (and no authentication is requested) when the
+    settings already match the ones stored on disk.
+
     Args:
         settings (dict): The settings to persist in the settings file.
         main_window (Gtk.Window, optional): If provided, logs will be printed to this GUI window.
@@ -79,10 +172,17 @@ def save_settings_with_privileges(settings: dict, main_window=None):
     Raises:
         RuntimeError: If the helper script fails to save the settings.
     """
+    # Skip the privileged roundtrip if the file already holds these settings
+    if settings_unchanged(settings):
+        return
+
+    tmp_path = None
     try:
         # Create temporary JSON file to pass to privileged helper
-        with tempfile.NamedTemporaryFile("w", delete=False) as tmp:
-            json.dump(settings, tmp, indent=4)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=tempfile.gettempdir(), delete=False
+        ) as tmp:
+            tmp.write(json_utils.dumps(settings))
             tmp_path = tmp.name
 
         # Path to helper script that runs with privileges
@@ -101,6 +201,8 @@ def save_settings_with_privileges(settings: dict, main_window=None):
 
         # Forward output to GUI logs
         # if main_window:
+        #     from gi.repository import GLib  # Imported lazily: gi is costly
+        #
         #     if result.stdout:
         #         for line in result.stdout.strip().splitlines():
         #             GLib.idle_add(main_window.log, line)
@@ -114,5 +216,5 @@ def save_settings_with_privileges(settings: dict, main_window=None):
 
     finally:
         # Clean up temporary file
-        if os.path.exists(tmp_path):
+        if tmp_path and os.path.exists(tmp_path):
             os.remove(tmp_path)
@@ -9,8 +9,10 @@
 # --------------------------------------------------------------------
 
 import os
-import json
+import time
 from core.paths import STATE_PATH
+from core.utils import atomic_write
+from core import json_utils
 
 # Default structure including activity timestamps and monitoring flags
 DEFAULT_STATE = {
@@ -24,42 +26,181 @@ DEFAULT_STATE = {
     "last_weekly_monitoring_timestamp": 0,
 }
 
+# Flags cleared by reset_monitoring_flags()
+MONITORING_FLAGS = (
+    "threshold_reached",
+    "monitoring_30_reached",
+    "monitoring_60_reached",
+    "monitoring_90_reached",
+    "service_disabled",
+)
+
+# Last state read from or written to disk, keyed on the file's mtime
+_STATE_CACHE = {"mtime": None, "data": None}
+
+# Activity timestamps: only ever raised, so queued values can be merged
+# into a state file changed by someone else by keeping the most recent one
+TIMESTAMP_KEYS = ("last_login_timestamp", "last_input_timestamp")
+
+# Minimum delay (seconds) between two deferred writes of the state file
+# (also how far behind the GUI's "Last activity" row can be)
+FLUSH_INTERVAL = 300
+
+# State queued by queue_state() but not yet written to disk
+_PENDING_STATE = None
+_last_flush_ts = 0.0
+
+# Whether ensure_state_dir() already succeeded in this process
+_DIR_ENSURED = False
+
+# Bytes of the last state written by this process
+_LAST_PAYLOAD = None
+
 
 def ensure_state_dir():
-    """Ensure the state directory exists on disk."""
+    """Ensure the state directory exists on disk (checked once per process)."""
+    global _DIR_ENSURED
+
+    if _DIR_ENSURED:
+        return
     os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    _DIR_ENSURED = True
 
 
 def load_state():
     """
     Load persistent state from disk, including activity timestamps and flags.
 
+    The parsed file is cached and only re-read when its mtime changes.
+
     Returns:
         dict: Merged state with defaults if missing keys.
     """
     ensure_state_dir()
 
-    if os.path.exists(STATE_PATH):
-        try:
-            with open(STATE_PATH, "r") as f:
-                data = json.load(f)
-                return {**DEFAULT_STATE, **data}  # merge with defaults
-        except Exception:
-            pass  # fall back if corrupted
+    # Queued changes are newer than what this process last read, but the
+    # file may have been changed by someone else (e.g. reset-flags) since
+    if _PENDING_STATE is not None:
+        return dict(_merge_pending_state())
+
+    return _read_state_file()
+
+
+def _read_state_file():
+    """
+    Read the state file, going through the mtime-keyed cache.
+
+    Returns:
+        dict: State from disk merged with defaults (defaults if unreadable).
+    """
+    try:
+        mtime = os.stat(STATE_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return DEFAULT_STATE.copy()
+
+    # State values are scalars, so a shallow copy is enough to protect the cache
+    if mtime == _STATE_CACHE["mtime"]:
+        return dict(_STATE_CACHE["data"])  # unchanged since last read
+
+    try:
+        data = json_utils.load_file(STATE_PATH)
+        state = {**DEFAULT_STATE, **data}  # merge with defaults
+    except (OSError, ValueError, TypeError):
+        # Removed since the stat, unreadable, invalid JSON or not an object
+        return DEFAULT_STATE.copy()
+
+    _STATE_CACHE["mtime"] = mtime
+    _STATE_CACHE["data"] = dict(state)
+    return state
+
+
+def _merge_pending_state():
+    """
+    Rebase the queued state on the state file if it changed on disk.
+
+    When another process rewrote the file since this one last read or
+    wrote it, its content wins, except for the activity timestamps where
+    the most recent value is kept. The queued state is updated in place.
+
+    Returns:
+        dict: The (possibly rebased) queued state.
+    """
+    global _PENDING_STATE
 
-    return DEFAULT_STATE.copy()
+    if os.path.exists(STATE_PATH) and not _is_state_file_cached():
+        disk = _read_state_file()
+        for key in TIMESTAMP_KEYS:
+            disk[key] = max(disk[key], _PENDING_STATE.get(key, 0))
+        _PENDING_STATE = disk
+
+    return _PENDING_STATE
 
 
 def save_state(state: dict):
     """
-    Save the current state to disk.
+    Save the current state to disk (atomically).
+
+    The write is skipped when the content is identical to what this process
+    last wrote and the file hasn't been modified since.
 
     Args:
         state (dict): Dictionary containing timestamps and monitoring flags.
     """
+    global _PENDING_STATE, _last_flush_ts, _LAST_PAYLOAD
+
     ensure_state_dir()
-    with open(STATE_PATH, "w") as f:
-        json.dump(state, f, indent=4)
+    payload = json_utils.dumps(state, sort_keys=True)
+
+    if payload != _LAST_PAYLOAD or not _is_state_file_cached():
+        atomic_write(STATE_PATH, payload)
+        _LAST_PAYLOAD = payload
+
+        # Keep the cache in sync so the next load doesn't re-read our own write
+        _STATE_CACHE["mtime"] = os.stat(STATE_PATH).st_mtime_ns
+        _STATE_CACHE["data"] = dict(state)
+
+    _PENDING_STATE = None
+    _last_flush_ts = time.monotonic()
+
+
+def _is_state_file_cached():
+    """
+    Check that the state file on disk is the one held in the cache.
+
+    Returns:
+        bool: True if the file exists and its mtime matches the cached one.
+    """
+    try:
+        return os.stat(STATE_PATH).st_mtime_ns == _STATE_CACHE["mtime"]
+    except FileNotFoundError:
+        return False
+
+
+def queue_state(state: dict, force=False):
+    """
+    Keep the state in memory and write it at most once per FLUSH_INTERVAL.
+
+    Args:
+        state (dict): Dictionary containing timestamps and monitoring flags.
+        force (bool): Write immediately (e.g. after a threshold event).
+    """
+    global _PENDING_STATE
+
+    if force or time.monotonic() - _last_flush_ts > FLUSH_INTERVAL:
+        save_state(state)
+    else:
+        _PENDING_STATE = dict(state)
+
+
+def flush_state():
+    """
+    Write any state queued by queue_state() to disk.
+
+    Meant to be called on shutdown so no pending change is lost. Changes
+    made to the file by another process meanwhile are kept.
+    """
+    if _PENDING_STATE is not None:
+        save_state(_merge_pending_state())
 
 
 def reset_monitoring_flags():
@@ -67,12 +208,6 @@ def reset_monitoring_flags():
     Reset all monitoring flags to False (useful when restarting the service).
     """
     state = load_state()
-    for flag in [
-        "threshold_reached",
-        "monitoring_30_reached",
-        "monitoring_60_reached",
-        "monitoring_90_reached",
-        "service_disabled",
-    ]:
+    for flag in MONITORING_FLAGS:
         state[flag] = False
     save_state(state)
@@ -4,10 +4,29 @@
 # This module provides functions to check whether a user is currently
 # logged in, and to retrieve the timestamp of the most recent login.
 # It uses the `psutil` library for system-level user session information.
+# When the system bus is reachable, systemd-logind's SessionNew signal is
+# also watched, so logins too short to be seen by polling still count.
 # --------------------------------------------------------------------
 
+import logging
+import threading
+import time
 import psutil
-from datetime import datetime
+
+# logind D-Bus names used by the session watcher
+LOGIND_BUS_NAME = "org.freedesktop.login1"
+LOGIND_OBJECT_PATH = "/org/freedesktop/login1"
+LOGIND_MANAGER_INTERFACE = "org.freedesktop.login1.Manager"
+LOGIND_SESSION_INTERFACE = "org.freedesktop.login1.Session"
+
+# Maximum time (seconds) to wait for the watcher to subscribe to logind
+WATCHER_START_TIMEOUT = 5
+
+# Start time (POSIX seconds) of the last user session reported by logind
+_LAST_SESSION_START = None
+
+# Whether start_session_watcher() already started the watcher thread
+_WATCHER_STARTED = False
 
 
 def is_user_logged_in():
@@ -25,7 +44,7 @@ def get_last_login_time():
     Retrieve the timestamp of the most recent user login.
 
     Returns:
-        datetime | None: The datetime of the last login, or None if no users are logged in.
+        int | None: The POSIX timestamp of the last login, or None if no users are logged in.
 
     Note:
         - Only the first user from psutil.users() is considered.
@@ -35,5 +54,112 @@ def get_last_login_time():
     if not users:
         return None
 
-    # Convert the 'started' timestamp to a datetime object
-    return datetime.fromtimestamp(users[0].started)
+    return int(users[0].started)
+
+
+def get_login_info():
+    """
+    Retrieve both the login state and the last login time in a single query.
+
+    Equivalent to calling is_user_logged_in() and get_last_login_time(),
+    but psutil.users() is only read once.
+
+    Returns:
+        tuple[bool, int | None]: Whether a user is logged in, and the POSIX
+        timestamp of the last login (None if no users are logged in).
+    """
+    users = psutil.users()
+    last_login = int(users[0].started) if users else None
+
+    # A session reported by logind may have started (and ended) since
+    if _LAST_SESSION_START is not None:
+        last_login = max(last_login or 0, _LAST_SESSION_START)
+
+    return bool(users), last_login
+
+
+def start_session_watcher():
+    """
+    Watch logind's SessionNew signal in a background thread.
+
+    Each new user session (greeters and other non-user classes are
+    ignored) records its start time, picked up by get_login_info() on the
+    next tick even if the session already ended. Without gi or a reachable
+    system bus, login detection simply keeps relying on psutil polling.
+
+    Returns:
+        bool: True if the watcher is running, False if it's unavailable.
+    """
+    global _WATCHER_STARTED
+
+    if _WATCHER_STARTED:
+        return True
+
+    try:
+        from gi.repository import Gio, GLib  # Imported lazily: optional here
+    except ImportError:
+        logging.info("ℹ️ gi unavailable, logins are detected by polling only.")
+        return False
+
+    ready = threading.Event()
+    result = {}
+
+    def on_session_new(connection, sender, path, interface, signal, params):
+        global _LAST_SESSION_START
+
+        _, session_path = params.unpack()
+        try:
+            session = Gio.DBusProxy.new_sync(
+                connection,
+                Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+                None,
+                LOGIND_BUS_NAME,
+                session_path,
+                LOGIND_SESSION_INTERFACE,
+                None,
+            )
+            session_class = session.get_cached_property("Class")
+            if session_class is None or session_class.unpack() != "user":
+                return
+            started = session.get_cached_property("Timestamp")  # µs since epoch
+            started_ts = started.unpack() // 1_000_000 if started else 0
+        except GLib.Error:
+            return  # Session already gone or unreadable: can't tell its class
+
+        _LAST_SESSION_START = started_ts or int(time.time())
+
+    def run():
+        try:
+            context = GLib.MainContext()
+            context.push_thread_default()
+            connection = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            connection.signal_subscribe(
+                LOGIND_BUS_NAME,
+                LOGIND_MANAGER_INTERFACE,
+                "SessionNew",
+                LOGIND_OBJECT_PATH,
+                None,
+                Gio.DBusSignalFlags.NONE,
+                on_session_new,
+            )
+        except Exception as e:  # GLib.Error, or anything raised by the bindings
+            result["error"] = e
+            return
+        finally:
+            ready.set()  # Never leave the caller waiting
+
+        GLib.MainLoop(context).run()
+
+    threading.Thread(target=run, name="session-watcher", daemon=True).start()
+
+    if not ready.wait(WATCHER_START_TIMEOUT):
+        result["error"] = "timed out connecting to the system bus"
+
+    if "error" in result:
+        logging.warning(
+            "⚠️ logind unavailable, logins polled only: %s", result["error"]
+        )
+        return False
+
+    _WATCHER_STARTED = True
+    return True
@@ -4,10 +4,15 @@
 # This module contains helper functions used to:
 # - Convert timestamps into readable strings
 # - Convert an inactivity threshold (in minutes) into days/hours/minutes
+# - Write files atomically
+# - Read the tail of a (possibly large) text file
 # --------------------------------------------------------------------
 
 from datetime import datetime
+from functools import lru_cache
 import logging
+import os
+import tempfile
 import traceback
 
 
@@ -23,13 +28,17 @@ def format_timestamp(ts):
     """
     if not ts:
         return "—"
-    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.fromtimestamp(ts).isoformat(sep=" ", timespec="seconds")
 
 
+@lru_cache(maxsize=4096)
 def get_threshold_info(minutes):
     """
     Convert a number of minutes into a human-readable duration.
 
+    Results are cached: the GUI recomputes it on every keystroke in the
+    timeout field and on every service info refresh.
+
     Args:
         minutes (int): Total number of minutes.
 
@@ -64,7 +73,7 @@ def get_formatted_log_message(message: str) -> str:
     Returns:
         str: Formatted string with timestamp.
     """
-    now = datetime.now().strftime("%H:%M:%S")
+    now = datetime.now().time().isoformat(timespec="seconds")  # HH:MM:SS
     return f"[{now}] {message}"
 
 
@@ -81,15 +90,16 @@ def build_log_entry(message: str, exception: Exception = None) -> str:
         str: Full block to insert into the GUI log.
     """
     log_lines = [get_formatted_log_message(message)]
-    logging.info(message)
 
     if exception:
+        # One record carrying the whole trace, formatted by the logging module
+        logging.info(message, exc_info=exception)
         trace = traceback.format_exception(
             type(exception), exception, exception.__traceback__
         )
-        log_lines.extend(line.rstrip() for line in trace)
-        for line in trace:
-            logging.info(line.strip())
+        log_lines.append("".join(trace).rstrip())
+    else:
+        logging.info(message)
 
     return "\n".join(log_lines) + "\n"
 
@@ -104,13 +114,54 @@ def log_to_gui_buffer(log_buffer, log_view, message: str, exception: Exception =
         message (str): The message to display.
         exception (Exception, optional): An optional exception to include.
     """
-    full_text = build_log_entry(message, exception)
-    end_iter = log_buffer.get_end_iter()
-    log_buffer.insert(end_iter, full_text)
+    append_to_gui_buffer(log_buffer, log_view, build_log_entry(message, exception))
+
+
+def append_to_gui_buffer(log_buffer, log_view, text: str, tag=None):
+    """
+    Append already-built log text to the GTK text buffer and scroll down.
+
+    Text is inserted at the "log_end" mark, created on first use unless the
+    window already did: with right gravity it stays at the end of the buffer
+    as text is appended, so no end iterator has to be recomputed.
+
+    Args:
+        log_buffer (Gtk.TextBuffer): The text buffer used for logging.
+        log_view (Gtk.TextView): The view displaying the buffer.
+        text (str): One or more complete log entries.
+        tag (Gtk.TextTag, optional): Tag applied as part of the insert itself
+            (no separate apply_tag pass over the inserted range).
+    """
+    mark = log_buffer.get_mark("log_end")
+    if mark is None:
+        mark = log_buffer.create_mark("log_end", log_buffer.get_end_iter(), False)
 
-    # Create a mark and scroll to it reliably
-    mark = log_buffer.create_mark(None, log_buffer.get_end_iter(), False)
-    log_view.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
+    end_iter = log_buffer.get_iter_at_mark(mark)
+    if tag is None:
+        log_buffer.insert(end_iter, text)
+    else:
+        log_buffer.insert_with_tags(end_iter, text, tag)
+    log_view.scroll_mark_onscreen(mark)
+
+
+def trim_text_buffer(text_buffer, max_lines, margin=0):
+    """
+    Delete the oldest lines of a GTK text buffer to keep at most max_lines.
+
+    Nothing is done until the buffer exceeds max_lines by more than
+    `margin` lines, so that deletes stay rare when lines arrive one by one.
+
+    Args:
+        text_buffer (Gtk.TextBuffer): The buffer to trim.
+        max_lines (int): Number of lines kept after a trim.
+        margin (int): Extra lines tolerated before trimming.
+    """
+    line_count = text_buffer.get_line_count()
+    if line_count <= max_lines + margin:
+        return
+
+    cutoff = text_buffer.get_iter_at_line(line_count - max_lines)
+    text_buffer.delete(text_buffer.get_start_iter(), cutoff)
 
 
 def log_info(enable_logs, *args):
@@ -126,9 +177,83 @@ def log_info(enable_logs, *args):
         *args: Parts of the message to concatenate and log. Each arg is
                converted to a string and joined with spaces.
 
+    Arguments are only converted to strings once the message is known to be
+    emitted, so callers should pass values as separate args rather than
+    pre-formatting them with f-strings.
+
     Example:
         log_info(True, "Service started with PID:", 1234)
     """
-    if enable_logs:
+    if enable_logs and logging.getLogger().isEnabledFor(logging.INFO):
         message = " ".join(str(arg) for arg in args)
         logging.info(message)
+
+
+def tail_lines(path, lines, block_size=8192, end=None):
+    """
+    Return the last lines of a file without reading the whole file.
+
+    The file is read backwards in fixed-size blocks until enough newlines
+    have been seen, so the cost depends on the tail size, not the file size.
+
+    Args:
+        path (str): File to read.
+        lines (int): Number of lines to return.
+        block_size (int): Size of each backward read, in bytes.
+        end (int, optional): Offset to read back from (default: end of file).
+
+    Returns:
+        str: The last `lines` lines (undecodable bytes are replaced).
+
+    Raises:
+        OSError: If the file can't be opened or read.
+    """
+    blocks = []
+    newlines = 0
+
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END) if end is None else end
+
+        # One extra newline: the last line normally ends with one
+        while pos > 0 and newlines <= lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+    data = b"".join(reversed(blocks))
+    tail = data.splitlines(keepends=True)[-lines:]
+    return b"".join(tail).decode(errors="replace")
+
+
+def atomic_write(path, payload: bytes, mode=0o644, fsync=True):
+    """
+    Write a file atomically: write to a temporary file, then rename it.
+
+    The payload is written with a single write() call into a temporary file
+    in the same directory, which then replaces the target with os.replace().
+    Readers never observe a partially written file, even if the process is
+    killed mid-write.
+
+    Args:
+        path (str): Destination file path.
+        payload (bytes): Full file content.
+        mode (int): Permissions of the resulting file (default: 0o644).
+        fsync (bool): Flush the data to disk before the rename.
+    """
+    directory = os.path.dirname(path)
+    name = os.path.basename(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), mode)  # mkstemp creates files as 0600
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -28,6 +28,10 @@ sudo systemctl stop "$SERVICE_NAME" 2>/dev/null || true
 # Rsync project to /opt
 sudo rsync -a --delete "${EXCLUDES[@]}" . "$TARGET_DIR/"
 
+# Precompile bytecode: /opt is root-owned, so the GUI can't write __pycache__
+# itself, and each pkexec helper would otherwise recompile its imports on launch
+sudo python3 -m compileall -q "$TARGET_DIR/core" "$TARGET_DIR/gui" "$TARGET_DIR/scripts" "$TARGET_DIR/service" "$TARGET_DIR/main.py"
+
 # Ensure scripts are executable
 sudo chmod +x "$TARGET_DIR/scripts/install_venv.sh"
 sudo chmod +x "$TARGET_DIR/scripts/restart.sh"
@@ -7,7 +7,9 @@
 # --------------------------------------------------------------------
 
 from gi.repository import Gtk, GLib
+import re
 import threading
+from core import json_utils
 from core.config_manager import (
     load_config,
     save_config_with_privileges,
@@ -18,6 +20,21 @@ from core.email_utils import (
 )
 from core.utils import get_threshold_info
 
+# Separator between recipients, swallowing surrounding whitespace
+RECIPIENT_SEPARATOR = re.compile(r"\s*,\s*")
+
+# Single-line form fields: (value name, label, entry attribute), in display order
+EMAIL_FIELDS = (
+    ("recipients", "Recipients (comma-separated):", "email_entry"),
+    ("subject", "Email subject:", "subject_entry"),
+)
+SMTP_FIELDS = (
+    ("smtp_host", "SMTP host:", "smtp_host_entry"),
+    ("smtp_port", "SMTP port:", "smtp_port_entry"),
+    ("smtp_user", "SMTP username:", "smtp_user_entry"),
+    ("smtp_pass", "SMTP password:", "smtp_pass_entry"),
+)
+
 
 class ConfigurationTab(Gtk.Grid):
     """
@@ -55,17 +72,8 @@ class ConfigurationTab(Gtk.Grid):
         self.attach(self.timeout_info_label, 1, row, 1, 1)
         row += 1
 
-        # === Recipients input ===
-        self.email_entry = Gtk.Entry()
-        self.attach(Gtk.Label(label="Recipients (comma-separated):"), 0, row, 1, 1)
-        self.attach(self.email_entry, 1, row, 1, 1)
-        row += 1
-
-        # === Email subject ===
-        self.subject_entry = Gtk.Entry()
-        self.attach(Gtk.Label(label="Email subject:"), 0, row, 1, 1)
-        self.attach(self.subject_entry, 1, row, 1, 1)
-        row += 1
+        # === Recipients and subject inputs ===
+        row = self.attach_entries(EMAIL_FIELDS, row)
 
         # === Email content textarea ===
         self.message_buffer = Gtk.TextBuffer()
@@ -91,27 +99,9 @@ class ConfigurationTab(Gtk.Grid):
         row += 1
 
         # === SMTP configuration inputs ===
-        self.smtp_host_entry = Gtk.Entry()
-        self.attach(Gtk.Label(label="SMTP host:"), 0, row, 1, 1)
-        self.attach(self.smtp_host_entry, 1, row, 1, 1)
-        row += 1
-
-        self.smtp_port_entry = Gtk.Entry()
-        self.attach(Gtk.Label(label="SMTP port:"), 0, row, 1, 1)
-        self.attach(self.smtp_port_entry, 1, row, 1, 1)
-        row += 1
-
-        self.smtp_user_entry = Gtk.Entry()
-        self.attach(Gtk.Label(label="SMTP username:"), 0, row, 1, 1)
-        self.attach(self.smtp_user_entry, 1, row, 1, 1)
-        row += 1
-
-        self.smtp_pass_entry = Gtk.Entry()
+        row = self.attach_entries(SMTP_FIELDS, row)
         self.smtp_pass_entry.set_visibility(False)
         self.smtp_pass_entry.set_placeholder_text("(leave blank to keep current)")
-        self.attach(Gtk.Label(label="SMTP password:"), 0, row, 1, 1)
-        self.attach(self.smtp_pass_entry, 1, row, 1, 1)
-        row += 1
 
         # === Bottom separator ===
         separator_bottom = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
@@ -128,14 +118,45 @@ class ConfigurationTab(Gtk.Grid):
         save_button.connect("clicked", self.on_save_clicked)
         self.attach(save_button, 1, row, 1, 1)
 
+        # === Single-line fields read by collect_form_values() ===
+        self.text_fields = (("timeout", self.timeout_entry),) + tuple(
+            (name, getattr(self, attribute))
+            for name, _, attribute in EMAIL_FIELDS + SMTP_FIELDS
+        )
+
+    def attach_entries(self, fields, row):
+        """
+        Create a labelled Gtk.Entry per field and attach them on consecutive rows.
+
+        Args:
+            fields (tuple): (value name, label, entry attribute) triples.
+            row (int): Grid row of the first field.
+
+        Returns:
+            int: The next free grid row.
+        """
+        for _, label_text, attribute in fields:
+            entry = Gtk.Entry()
+            setattr(self, attribute, entry)
+            self.attach(Gtk.Label(label=label_text), 0, row, 1, 1)
+            self.attach(entry, 1, row, 1, 1)
+            row += 1
+
+        return row
+
     def load_config(self):
         """
-        Load configuration from disk and populate form fields.
+        Populate form fields from the configuration loaded by the main window.
+
+        If the main window is still loading it in the background, this is
+        called again once the configuration is available.
         """
+        if not self.main_window.config_loaded:
+            return
 
         self.main_window.log("⏳ Loading configuration.")
 
-        config = load_config()
+        config = self.main_window.config
         if not config:
             self.main_window.log("❌ No configuration found.")
             return
@@ -158,20 +179,37 @@ class ConfigurationTab(Gtk.Grid):
     def on_save_clicked(self, button):
         """ "
         Validate config and save if valid. Avoid privilege elevation if invalid.
+
+        Only reading the form happens on the GTK main thread; parsing,
+        validation and the privileged save all run in a worker thread.
+        Saving is skipped (no pkexec prompt) when nothing has changed.
         """
 
         self.main_window.log("-------------------------------------------")
         self.main_window.log("👤 You have requested to save the configuration.")
 
-        try:
-            config = self.build_config()  # Peut lever une exception
-        except Exception as e:
-            self.main_window.log("❌ Invalid configuration. Please fix errors.", e)
-            return
+        values = self.collect_form_values()
 
         def worker():
             try:
+                config = self.build_config(values)
+            except Exception as e:
+                GLib.idle_add(
+                    self.main_window.log,
+                    "❌ Invalid configuration. Please fix errors.",
+                    e,
+                )
+                return
+
+            try:
+                # Blank password = keep current: nothing to save if all else
+                # matches (load_config() also blanks it, and is cached)
+                if not config["email"]["smtp_pass"] and config == load_config():
+                    GLib.idle_add(self.main_window.log, "ℹ️ No changes to save.")
+                    return
+
                 save_config_with_privileges(config, self.main_window)
+                self.main_window.refresh_config()
                 GLib.idle_add(
                     self.main_window.log, "✅ Configuration saved successfully."
                 )
@@ -180,33 +218,46 @@ class ConfigurationTab(Gtk.Grid):
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def build_config(self):
+    def collect_form_values(self):
         """
-        Build config from user input. Raises if validation fails.
+        Read the raw (stripped) text of every form field. Must run on the main thread.
+
+        Returns:
+            dict: Field name -> text, including the email message.
         """
-        timeout = self.timeout_entry.get_text().strip()
-        recipients = self.email_entry.get_text().strip()
-        subject = self.subject_entry.get_text().strip()
-        smtp_host = self.smtp_host_entry.get_text().strip()
-        smtp_port = self.smtp_port_entry.get_text().strip()
-        smtp_user = self.smtp_user_entry.get_text().strip()
-        smtp_pass = self.smtp_pass_entry.get_text().strip()
+        values = {name: entry.get_text().strip() for name, entry in self.text_fields}
 
         start_iter = self.message_buffer.get_start_iter()
         end_iter = self.message_buffer.get_end_iter()
-        message = self.message_buffer.get_text(start_iter, end_iter, True).strip()
+        values["message"] = self.message_buffer.get_text(
+            start_iter, end_iter, True
+        ).strip()
+
+        return values
+
+    def build_config(self, values):
+        """
+        Build config from the collected form values. Raises if validation fails.
+
+        This doesn't touch any widget, so it can run in a worker thread.
+
+        Args:
+            values (dict): Values returned by collect_form_values().
 
+        Returns:
+            dict: The validated configuration.
+        """
         config = {
-            "timeout_minutes": int(timeout),
+            "timeout_minutes": int(values["timeout"]),
             "email": {
-                "to": [r.strip() for r in recipients.split(",") if r.strip()],
-                "smtp_server": smtp_host,
-                "smtp_port": int(smtp_port),
-                "smtp_user": smtp_user,
-                "smtp_pass": smtp_pass,
+                "to": [r for r in RECIPIENT_SEPARATOR.split(values["recipients"]) if r],
+                "smtp_server": values["smtp_host"],
+                "smtp_port": int(values["smtp_port"]),
+                "smtp_user": values["smtp_user"],
+                "smtp_pass": values["smtp_pass"],
             },
-            "message": message,
-            "subject": subject,
+            "message": values["message"],
+            "subject": values["subject"],
         }
 
         # This will raise an error if invalid, caught in the worker
@@ -221,22 +272,35 @@ class ConfigurationTab(Gtk.Grid):
         try:
             minutes = int(self.timeout_entry.get_text().strip())
             to_display = get_threshold_info(minutes)
-            self.timeout_info_label.set_text(to_display)
         except ValueError:
-            self.timeout_info_label.set_text("")
+            to_display = ""
+
+        # Avoid a label re-layout when the text doesn't change
+        if to_display != self.timeout_info_label.get_text():
+            self.timeout_info_label.set_text(to_display)
 
     def on_test_smtp_clicked(self, button):
         """
         Send a test email using a privileged script with decrypted config.
+
+        The configuration currently in the form is tested when it is valid,
+        so unsaved edits can be checked; otherwise the saved one is used.
         """
         self.test_smtp_button.set_sensitive(False)
         self.main_window.log("-------------------------------------------")
         self.main_window.log("✉️ Sending test email using privileged script...")
 
+        values = self.collect_form_values()
+
         def worker():
             import subprocess
             import os
 
+            try:
+                form_config = json_utils.dumps(self.build_config(values))
+            except Exception:
+                form_config = b""  # Incomplete form: test the saved config
+
             script_path = os.path.join(
                 os.path.dirname(__file__), "..", "scripts", "send_test_email_helper.py"
             )
@@ -245,8 +309,8 @@ class ConfigurationTab(Gtk.Grid):
             try:
                 result = subprocess.run(
                     ["pkexec", "python3", script_path],
+                    input=form_config,
                     capture_output=True,
-                    text=True,
                     check=True,
                 )
                 GLib.idle_add(self.main_window.log, "✅ Test email sent successfully.")
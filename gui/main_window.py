@@ -2,9 +2,11 @@
 # 🪟 MAIN WINDOW: Initializes the GTK interface with notebook tabs
 # --------------------------------------------------------------------
 # This module defines the main application window, including:
-# - A GTK notebook with two tabs: Service and Configuration.
+# - A GTK notebook with three tabs: Service, Configuration and Settings
+#   (the last two are only built the first time they are shown).
 # - A persistent logging area at the bottom of the window.
-# - A method to log messages from anywhere in the GUI.
+# - A method to log messages from anywhere in the GUI (entries are
+#   batched and flushed into the log view from the GTK main loop).
 # --------------------------------------------------------------------
 
 import gi
@@ -23,17 +25,25 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
+import threading
 import traceback
+from collections import deque
 from datetime import datetime
 from gui.service_tab import ServiceTab
 from gui.configuration_tab import ConfigurationTab
 from gui.settings_tab import SettingsTab
-from core.utils import log_to_gui_buffer
+from core.utils import build_log_entry, append_to_gui_buffer, trim_text_buffer
+from core.config_manager import load_config
 
 
 from core.version import __version__
 
+# Lines kept in the GUI log view; trimming starts once the buffer exceeds
+# the limit by LOG_TRIM_MARGIN lines so deletes stay rare
+MAX_LOG_LINES = 2000
+LOG_TRIM_MARGIN = 200
+
 
 class MainWindow(Gtk.Window):
     """
@@ -58,6 +68,15 @@ class MainWindow(Gtk.Window):
 
         # === Log view must be created early so tabs can use it ===
         self.log_buffer = Gtk.TextBuffer()
+        # Right-gravity mark that stays at the end: new log text goes there
+        self.log_end_mark = self.log_buffer.create_mark(
+            "log_end", self.log_buffer.get_end_iter(), False
+        )
+        # Single tag shared by every entry (aligned timestamps and tracebacks)
+        self.log_tag = self.log_buffer.create_tag("log", family="monospace")
+        self.pending_logs = deque()  # Entries waiting for the next flush
+        self.pending_logs_lock = threading.Lock()
+        self.flush_scheduled = False
 
         # === Log viewer (bottom panel) ===
         self.log_view = Gtk.TextView(buffer=self.log_buffer)
@@ -85,29 +104,136 @@ class MainWindow(Gtk.Window):
         notebook = Gtk.Notebook()
         main_box.pack_start(notebook, True, True, 0)
 
-        # === Tab 1: Service ===
+        # === Configuration shared by the tabs (parsed once, off the main thread) ===
+        self.config = None
+        self.config_loaded = False
+        self.refresh_config()
+
+        # === Tab 1: Service (default page, built right away) ===
         self.service_tab = ServiceTab(self)
         notebook.append_page(self.service_tab, Gtk.Label(label="Service"))
 
-        # === Tab 2: Configuration ===
-        self.configuration_tab = ConfigurationTab(self)
-        notebook.append_page(self.configuration_tab, Gtk.Label(label="Configuration"))
+        # === Tabs 2 & 3: Configuration and Settings (built on first display) ===
+        self.configuration_tab = None
+        self.settings_tab = None
+        self.lazy_tabs = {}  # page number -> (placeholder box, attribute, class)
+
+        for attribute, tab_class, label in (
+            ("configuration_tab", ConfigurationTab, "Configuration"),
+            ("settings_tab", SettingsTab, "Settings"),
+        ):
+            placeholder = Gtk.Box()
+            page_num = notebook.append_page(placeholder, Gtk.Label(label=label))
+            self.lazy_tabs[page_num] = (placeholder, attribute, tab_class)
 
-        # === Tab 3: Configuration ===
-        self.settings_tab = SettingsTab(self)
-        notebook.append_page(self.settings_tab, Gtk.Label(label="Settings"))
+        notebook.connect("switch-page", self.on_switch_page)
 
         main_box.pack_start(log_frame, False, False, 0)
 
+    def refresh_config(self):
+        """
+        Re-read the configuration from disk in a background thread.
+
+        The result is handed back to the main loop through apply_config().
+        Safe to call from any thread (e.g. after the configuration is saved).
+        """
+
+        def worker():
+            try:
+                config = load_config()
+            except Exception as e:
+                GLib.idle_add(self.log, "❌ Error loading configuration.", e)
+                config = None
+            GLib.idle_add(self.apply_config, config)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def apply_config(self, config):
+        """
+        Store a freshly loaded configuration (runs on the GTK main thread).
+
+        On the first load, the Configuration tab is populated if it was
+        already built; later reloads leave the form as the user left it.
+
+        Args:
+            config (dict or None): The loaded configuration.
+
+        Returns:
+            bool: False, so GLib runs this idle callback only once.
+        """
+        first_load = not self.config_loaded
+        self.config = config
+        self.config_loaded = True
+
+        if first_load and self.configuration_tab:
+            self.configuration_tab.load_config()
+        return False
+
+    def on_switch_page(self, notebook, page, page_num):
+        """
+        Build a lazily loaded tab inside its placeholder the first time it is shown.
+
+        Args:
+            notebook (Gtk.Notebook): The notebook emitting the signal.
+            page (Gtk.Widget): The page being shown.
+            page_num (int): Index of the page being shown.
+        """
+        if page_num not in self.lazy_tabs:
+            return
+
+        placeholder, attribute, tab_class = self.lazy_tabs.pop(page_num)
+        tab = tab_class(self)
+        setattr(self, attribute, tab)
+        placeholder.pack_start(tab, True, True, 0)
+        placeholder.show_all()
+
     def log(self, message, exception=None):
         """
         Append a message to the GUI log view and system log.
 
+        The entry is timestamped and written to the system log immediately,
+        but only queued for the view: bursts of messages are inserted
+        together by flush_logs() on the next idle cycle of the main loop.
+        This makes it safe to call from worker threads as well.
+
         Args:
             message (str): The message to log.
             exception (Exception, optional): An exception to include.
         """
-        log_to_gui_buffer(self.log_buffer, self.log_view, message, exception)
+        entry = build_log_entry(message, exception)
+
+        with self.pending_logs_lock:
+            self.pending_logs.append(entry)
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+
+        GLib.idle_add(self.flush_logs)
+
+    def flush_logs(self):
+        """
+        Insert all queued log entries into the log view in a single insert.
+
+        Returns:
+            bool: False, so GLib runs this idle callback only once.
+        """
+        with self.pending_logs_lock:
+            text = "".join(self.pending_logs)
+            self.pending_logs.clear()
+            self.flush_scheduled = False
+
+        if text:
+            append_to_gui_buffer(self.log_buffer, self.log_view, text, self.log_tag)
+            self.trim_log()
+        return False
+
+    def trim_log(self):
+        """
+        Drop the oldest lines of the log view to keep it at MAX_LOG_LINES.
+
+        The full history is still available in the GUI log file.
+        """
+        trim_text_buffer(self.log_buffer, MAX_LOG_LINES, LOG_TRIM_MARGIN)
 
 
 def launch_gui():
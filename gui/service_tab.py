@@ -8,7 +8,7 @@
 # - Controls to start/stop/restart the systemd service
 # --------------------------------------------------------------------
 
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, Gio
 from core.paths import (
     LOG_PATH,
     CONFIG_PATH,
@@ -20,11 +20,47 @@ from core.paths import (
 
 import os
 import subprocess
+import threading
+from shutil import which
 from core.state_manager import load_state
 from core.config_manager import load_config
-from core.utils import format_timestamp, get_threshold_info
+from core.utils import (
+    format_timestamp,
+    get_threshold_info,
+    tail_lines,
+    trim_text_buffer,
+)
 from core.service_utils import run_service_command
 
+# Verbose GUI log when set (IM_DEBUG=1): also report automatic log reloads
+DEBUG = os.environ.get("IM_DEBUG") == "1"
+
+# Lines kept in the service log view as new lines get appended
+MAX_SERVICE_LOG_LINES = 2000
+
+# Delay (ms) during which newly read log text is gathered into one insert
+SERVICE_LOG_FLUSH_DELAY = 150
+
+# Fallback refresh (ms), mostly useful when the systemd D-Bus API isn't reachable
+SERVICE_INFO_REFRESH_INTERVAL = 30000
+
+# Absolute path of systemctl, resolved once rather than on every spawn
+SYSTEMCTL = which("systemctl") or "/usr/bin/systemctl"
+
+# systemd unit whose state is displayed (and its D-Bus names)
+SERVICE_UNIT = "inactivity-monitor.service"
+SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+SYSTEMD_OBJECT_PATH = "/org/freedesktop/systemd1"
+SYSTEMD_MANAGER_INTERFACE = "org.freedesktop.systemd1.Manager"
+SYSTEMD_UNIT_INTERFACE = "org.freedesktop.systemd1.Unit"
+
+# File monitor events meaning a (re)written file is ready to be read again
+FILE_REWRITTEN_EVENTS = (
+    Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+    Gio.FileMonitorEvent.CREATED,
+    Gio.FileMonitorEvent.DELETED,
+)
+
 
 class ServiceTab(Gtk.Grid):
     """
@@ -34,12 +70,19 @@ class ServiceTab(Gtk.Grid):
 
     def __init__(self, main_window):
         """
-        Initialize the tab and schedule automatic updates every 3 seconds.
+        Initialize the tab, watch the state/config/log files for changes
+        and schedule a slow fallback refresh of the service status.
         """
         super().__init__(column_spacing=10, row_spacing=10, margin=10)
         self.main_window = main_window
         self.service_info_labels = {}
+        self.displayed_info = {}  # Text last set on each info row
+        self.service_log_offset = None  # Bytes of service.log already read
+        self.pending_service_log = []  # Read text waiting for the next flush
+        self.service_log_flush_id = None
+        self.file_monitors = []  # Keep references: monitors stop when collected
         self.build_ui()
+        self.unit_proxy = self.create_unit_proxy()
 
         self.service_info_labels["LOG_PATH"].set_text(f"tail -n 200 {LOG_PATH}")
         self.service_info_labels["GUI_LOG_PATH"].set_text(f"tail -n 200 {GUI_LOG_PATH}")
@@ -48,8 +91,132 @@ class ServiceTab(Gtk.Grid):
         self.service_info_labels["STATE_PATH"].set_text(f"cat {STATE_PATH}")
         self.service_info_labels["KEY_PATH"].set_text(f"{KEY_PATH}")
 
-        GLib.timeout_add(3000, self.check_and_display_service_info)
-        self.load_service_log()
+        self.watch_file(STATE_PATH, self.on_state_file_changed)
+        self.watch_file(CONFIG_PATH, self.on_config_file_changed)
+        self.watch_file(LOG_PATH, self.on_service_log_changed)
+
+        self.check_and_display_service_info()
+        GLib.timeout_add(
+            SERVICE_INFO_REFRESH_INTERVAL, self.check_and_display_service_info
+        )
+        self.load_service_log(announce=DEBUG)
+
+    def watch_file(self, path, handler):
+        """
+        Call handler(event) whenever GIO reports a change to the given file.
+
+        Args:
+            path (str): File to watch (it doesn't need to exist yet).
+            handler (callable): Receives the Gio.FileMonitorEvent.
+        """
+        try:
+            monitor = Gio.File.new_for_path(path).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except GLib.Error as e:
+            self.main_window.log(f"⚠️ Can't watch {path}, relying on refreshes.", e)
+            return
+
+        monitor.connect("changed", lambda m, f, other, event: handler(event))
+        self.file_monitors.append(monitor)
+
+    def create_unit_proxy(self):
+        """
+        Create a D-Bus proxy on the systemd unit, pushing ActiveState changes.
+
+        The proxy caches the unit properties and updates them from systemd's
+        PropertiesChanged signals, so reading the status costs no process
+        spawn and no bus round trip.
+
+        Returns:
+            Gio.DBusProxy or None: The proxy, or None if systemd can't be
+            reached over D-Bus (systemctl is used instead).
+        """
+        try:
+            bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            unit_path = bus.call_sync(
+                SYSTEMD_BUS_NAME,
+                SYSTEMD_OBJECT_PATH,
+                SYSTEMD_MANAGER_INTERFACE,
+                "LoadUnit",
+                GLib.Variant("(s)", (SERVICE_UNIT,)),
+                GLib.VariantType("(o)"),
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            ).unpack()[0]
+
+            # systemd only emits unit signals while a client is subscribed
+            bus.call_sync(
+                SYSTEMD_BUS_NAME,
+                SYSTEMD_OBJECT_PATH,
+                SYSTEMD_MANAGER_INTERFACE,
+                "Subscribe",
+                None,
+                None,
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            )
+
+            proxy = Gio.DBusProxy.new_sync(
+                bus,
+                Gio.DBusProxyFlags.NONE,
+                None,
+                SYSTEMD_BUS_NAME,
+                unit_path,
+                SYSTEMD_UNIT_INTERFACE,
+                None,
+            )
+        except GLib.Error as e:
+            self.main_window.log(
+                "⚠️ systemd D-Bus API unavailable, using systemctl.", e
+            )
+            return None
+
+        proxy.connect(
+            "g-properties-changed",
+            lambda *args: self.check_and_display_service_status(),
+        )
+        return proxy
+
+    def get_service_status(self):
+        """
+        Return the unit's ActiveState ("active", "inactive", "failed"...).
+
+        Read from the D-Bus proxy cache when available, otherwise by running
+        `systemctl is-active`.
+
+        Returns:
+            str: The service state.
+        """
+        if self.unit_proxy is not None:
+            active_state = self.unit_proxy.get_cached_property("ActiveState")
+            if active_state is not None:
+                return active_state.unpack()
+
+        # Single ASCII word: read raw bytes, no locale decoding, stderr dropped
+        result = subprocess.run(
+            [SYSTEMCTL, "is-active", "inactivity-monitor"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return result.stdout.strip().decode("ascii", errors="replace")
+
+    def on_state_file_changed(self, event):
+        """Refresh the activity times when the service rewrites the state file."""
+        if event in FILE_REWRITTEN_EVENTS:
+            self.check_and_display_activity_time(load_state())
+
+    def on_config_file_changed(self, event):
+        """Refresh the threshold when the configuration file is rewritten."""
+        if event in FILE_REWRITTEN_EVENTS:
+            self.check_and_display_threshold(load_config())
+
+    def on_service_log_changed(self, event):
+        """Pick up new service log lines as soon as they are written."""
+        if event == Gio.FileMonitorEvent.CHANGED or event in FILE_REWRITTEN_EVENTS:
+            self.load_service_log(announce=DEBUG)
 
     def build_ui(self):
         """
@@ -66,14 +233,15 @@ class ServiceTab(Gtk.Grid):
             Add a key-value info line to the listbox.
             """
             list_row = Gtk.ListBoxRow()
-            hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-            label = Gtk.Label(label=label_text, xalign=0)
+            row_grid = Gtk.Grid(column_spacing=10)
+            label = Gtk.Label(label=label_text, xalign=0, hexpand=True)
             value_label = Gtk.Label(label=value_text, xalign=1)
             value_label.set_selectable(True)
 
-            hbox.pack_start(label, True, True, 0)
-            hbox.pack_end(value_label, False, False, 0)
-            list_row.add(hbox)
+            # Two fixed cells: no per-child packing negotiation as with a Box
+            row_grid.attach(label, 0, 0, 1, 1)
+            row_grid.attach(value_label, 1, 0, 1, 1)
+            list_row.add(row_grid)
 
             self.info_listbox.add(list_row)
             self.service_info_labels[key] = value_label
@@ -152,6 +320,7 @@ class ServiceTab(Gtk.Grid):
         scrolled.set_min_content_height(200)
         scrolled.set_min_content_width(300)
         scrolled.add(self.service_log_view)
+        self.service_log_scrolled = scrolled
 
         frame = Gtk.Frame(label="Service log:")
         frame.set_shadow_type(Gtk.ShadowType.IN)
@@ -162,23 +331,53 @@ class ServiceTab(Gtk.Grid):
     def check_and_display_service_info(self):
         """
         Refresh service information and update UI values.
+
+        The rows are updated as one batch: child notifications of the
+        listbox are held back until every label has been set.
         """
         state = load_state()
         config = load_config()
-        self.check_and_display_service_status()
-        self.check_and_display_activity_time(state)
 
+        self.info_listbox.freeze_child_notify()
+        try:
+            self.check_and_display_service_status()
+            self.check_and_display_activity_time(state)
+            self.check_and_display_threshold(config)
+        finally:
+            self.info_listbox.thaw_child_notify()
+
+        return True  # Ensure timeout continues
+
+    def set_info_text(self, key, text):
+        """
+        Update an info row, skipping the label update if the text is unchanged.
+
+        Setting a Gtk.Label to its current text still notifies and
+        re-lays it out, and most refreshes change nothing.
+
+        Args:
+            key (str): Key of the row in service_info_labels.
+            text (str): Text to display.
+        """
+        if self.displayed_info.get(key) == text:
+            return
+
+        self.displayed_info[key] = text
+        self.service_info_labels[key].set_text(text)
+
+    def check_and_display_threshold(self, config):
+        """
+        Display the inactivity threshold from the configuration.
+        """
         if not config:
             for key in [
                 "threshold",
             ]:
-                self.service_info_labels[key].set_text("⚠️ No configuration found.")
+                self.set_info_text(key, "⚠️ No configuration found.")
         else:
             minutes = int(str(config.get("timeout_minutes", "0")).strip())
             threshold_to_display = get_threshold_info(minutes)
-            self.service_info_labels["threshold"].set_text(threshold_to_display)
-
-        return True  # Ensure timeout continues
+            self.set_info_text("threshold", threshold_to_display)
 
     def check_and_display_activity_time(self, state):
         """
@@ -187,52 +386,45 @@ class ServiceTab(Gtk.Grid):
         last_login_timestamp = state["last_login_timestamp"]
         last_input_timestamp = state["last_input_timestamp"]
 
-        self.service_info_labels["last_login"].set_text(
+        login_text = (
             format_timestamp(last_login_timestamp)
             if last_login_timestamp > 0
             else "⚠️ unknown"
         )
-        self.service_info_labels["last_input"].set_text(
+        input_text = (
             format_timestamp(last_input_timestamp)
             if last_input_timestamp > 0
             else "⚠️ unknown"
         )
 
+        self.set_info_text("last_login", login_text)
+        self.set_info_text("last_input", input_text)
+
     def check_and_display_service_status(self):
         """
-        Call systemctl to detect service status and update UI + button states.
+        Detect the service status and update UI + button states.
         """
         try:
-            result = subprocess.run(
-                ["systemctl", "is-active", "inactivity-monitor"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            status = result.stdout.strip()
+            status = self.get_service_status()
 
             if status == "active":
-                self.service_info_labels["status"].set_text("🟢 Service is running")
+                self.set_info_text("status", "🟢 Service is running")
                 self.start_button.set_sensitive(False)
                 self.stop_button.set_sensitive(True)
                 self.restart_button.set_sensitive(True)
             elif status == "inactive":
-                self.service_info_labels["status"].set_text("🔴 Service is inactive")
+                self.set_info_text("status", "🔴 Service is inactive")
                 self.start_button.set_sensitive(True)
                 self.stop_button.set_sensitive(False)
                 self.restart_button.set_sensitive(True)
             else:
-                self.service_info_labels["status"].set_text(
-                    f"⚠️ Service status: {status}"
-                )
+                self.set_info_text("status", f"⚠️ Service status: {status}")
                 self.start_button.set_sensitive(True)
                 self.stop_button.set_sensitive(False)
                 self.restart_button.set_sensitive(False)
 
         except Exception:
-            self.service_info_labels["status"].set_text(
-                "❌ Unable to check service status"
-            )
+            self.set_info_text("status", "❌ Unable to check service status")
             self.start_button.set_sensitive(False)
             self.stop_button.set_sensitive(False)
             self.restart_button.set_sensitive(False)
@@ -241,63 +433,168 @@ class ServiceTab(Gtk.Grid):
         """Callback for restarting the service."""
         self.main_window.log("-------------------------------------------")
         self.main_window.log("👤 You asked to restart the service.")
-        try:
-            output = run_service_command("restart")
-            self.main_window.log(output or "✅ Service restarted.")
-        except Exception as e:
-            self.main_window.log("❌ Failed to restart the service.", e)
-
-        self.check_and_display_service_info()
+        self.run_service_command_async(
+            "restart", "✅ Service restarted.", "❌ Failed to restart the service."
+        )
 
     def on_start_button_clicked(self, widget):
         """Callback for starting the service."""
         self.main_window.log("-------------------------------------------")
         self.main_window.log("👤 You asked to start the service.")
-        try:
-            output = run_service_command("start")
-            self.main_window.log(output or "✅ Service started.")
-        except Exception as e:
-            self.main_window.log("❌ Failed to start the service.", e)
-
-        self.check_and_display_service_info()
+        self.run_service_command_async(
+            "start", "✅ Service started.", "❌ Failed to start the service."
+        )
 
     def on_stop_button_clicked(self, widget):
         """You asked to stop the service."""
         self.main_window.log("-------------------------------------------")
         self.main_window.log("👤 You asked to stop the service.")
-        try:
-            output = run_service_command("stop")
-            self.main_window.log(output or "✅ Service stopped.")
-        except Exception as e:
-            self.main_window.log("❌ Failed to stop the service.", e)
+        self.run_service_command_async(
+            "stop", "✅ Service stopped.", "❌ Failed to stop the service."
+        )
 
-        self.check_and_display_service_info()
+    def run_service_command_async(self, command, success_message, failure_message):
+        """
+        Run a service command in a worker thread, keeping the UI responsive.
+
+        The control buttons are disabled until the command finishes, then
+        the service info refresh sets them back according to the new status.
+
+        Args:
+            command (str): "start", "stop" or "restart".
+            success_message (str): Logged if the helper printed nothing.
+            failure_message (str): Logged with the exception on failure.
+        """
+        for button in (self.start_button, self.stop_button, self.restart_button):
+            button.set_sensitive(False)
 
-    def load_service_log(self, lines=100):
+        def refresh():
+            self.check_and_display_service_info()
+            return False  # Run once (the periodic refresh returns True)
+
+        def worker():
+            try:
+                output = run_service_command(command)
+                GLib.idle_add(self.main_window.log, output or success_message)
+            except Exception as e:
+                GLib.idle_add(self.main_window.log, failure_message, e)
+
+            GLib.idle_add(refresh)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def load_service_log(self, lines=100, announce=True):
         """
-        Load the last N lines of the service log file into the log viewer.
+        Load the service log into the log viewer.
+
+        The first load (and any load after the log was rotated or truncated)
+        shows the last N lines; later loads only queue what was written
+        since, which flush_service_log() appends shortly after.
+
+        Args:
+            lines (int): Number of lines shown on a full load.
+            announce (bool): Report the load in the GUI log. Only explicit
+                             refreshes do by default; automatic loads pass
+                             DEBUG. Errors are always reported.
         """
 
-        self.main_window.log("⏳ Loading service logs.")
+        if announce:
+            self.main_window.log("⏳ Loading service logs.")
 
         try:
             if not os.path.exists(LOG_PATH):
-                self.service_log_buffer.set_text("service.log not found.")
+                self.reset_service_log("service.log not found.")
                 return True
 
-            with open(LOG_PATH, "r") as f:
-                content = f.readlines()[-lines:]
+            size = os.stat(LOG_PATH).st_size
 
-            self.service_log_buffer.set_text("".join(content))
-            GLib.idle_add(self.scroll_service_log_to_bottom)
-            self.main_window.log("✅ Service log loading complete.")
+            if self.service_log_offset is None or size < self.service_log_offset:
+                self.reset_service_log(tail_lines(LOG_PATH, lines, end=size))
+                self.service_log_offset = size
+                GLib.idle_add(self.scroll_service_log_to_bottom)
+            else:
+                self.read_new_service_log()
+
+            if announce:
+                self.main_window.log("✅ Service log loading complete.")
 
         except Exception as e:
-            self.service_log_buffer.set_text(f"Error reading service.log:\n{str(e)}")
+            self.reset_service_log(f"Error reading service.log:\n{str(e)}")
             self.main_window.log("⚠️ Service log loading complete whith error:", e)
 
         return True
 
+    def reset_service_log(self, text):
+        """
+        Replace the whole service log view, dropping any queued text.
+
+        The read offset is reset too, so the next load starts from the tail.
+
+        Args:
+            text (str): The new content of the view.
+        """
+        self.pending_service_log.clear()
+        self.service_log_offset = None
+        self.service_log_buffer.set_text(text)
+
+    def read_new_service_log(self):
+        """
+        Queue the complete lines written to the service log since the last read.
+
+        Reading stops at the last newline, so a line being written (or a
+        multi-byte character split across reads) is picked up next time.
+        """
+        with open(LOG_PATH, "rb") as f:
+            f.seek(self.service_log_offset)
+            new = f.read()
+
+        new = new[: new.rfind(b"\n") + 1]
+        if not new:
+            return
+
+        self.service_log_offset += len(new)
+        self.pending_service_log.append(new.decode(errors="replace"))
+
+        if self.service_log_flush_id is None:
+            self.service_log_flush_id = GLib.timeout_add(
+                SERVICE_LOG_FLUSH_DELAY, self.flush_service_log
+            )
+
+    def flush_service_log(self):
+        """
+        Append all queued service log text in a single insert.
+
+        The view follows the new lines only if it was already at the bottom,
+        so a user reading older lines keeps their position.
+
+        Returns:
+            bool: False, so the timeout runs only once.
+        """
+        self.service_log_flush_id = None
+        text = "".join(self.pending_service_log)
+        self.pending_service_log.clear()
+        if not text:
+            return False
+
+        at_bottom = self.is_service_log_at_bottom()
+        self.service_log_buffer.insert(self.service_log_buffer.get_end_iter(), text)
+        trim_text_buffer(self.service_log_buffer, MAX_SERVICE_LOG_LINES)
+
+        if at_bottom:
+            GLib.idle_add(self.scroll_service_log_to_bottom)
+        return False
+
+    def is_service_log_at_bottom(self):
+        """
+        Tell whether the service log view is scrolled to the bottom.
+
+        Returns:
+            bool: True if the last line is visible.
+        """
+        adjustment = self.service_log_scrolled.get_vadjustment()
+        bottom = adjustment.get_upper() - adjustment.get_page_size()
+        return adjustment.get_value() >= bottom - 1
+
     def scroll_service_log_to_bottom(self):
         """
         Scrolls the service log viewer to the bottom.
@@ -7,16 +7,21 @@
 # --------------------------------------------------------------------
 
 from gi.repository import Gtk, GLib
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from core.settings_manager import (
+    DEFAULT_SETTINGS,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
     load_settings,
     save_settings_with_privileges,
+    settings_unchanged,
     validate_settings,
 )
-from core.email_utils import validate_email_address
-from email_validator import EmailNotValidError
 import calendar
 
+# Weekday names (Monday first, current locale), resolved once at import
+DAY_NAMES = tuple(calendar.day_name)
+
 
 class SettingsTab(Gtk.Grid):
     """
@@ -34,6 +39,11 @@ class SettingsTab(Gtk.Grid):
         """
         super().__init__(column_spacing=10, row_spacing=10, margin=10)
         self.main_window = main_window
+
+        # Single worker: saves run one at a time, never two pkexec prompts at once
+        self.save_executor = ThreadPoolExecutor(max_workers=1)
+        self.save_future = None
+
         self.build_ui()
         self.load_settings()
 
@@ -48,6 +58,15 @@ class SettingsTab(Gtk.Grid):
         self.attach(self.logs_checkbox, 0, row, 2, 1)
         row += 1
 
+        # === Poll interval of the service ===
+        self.poll_interval_spin = Gtk.SpinButton()
+        self.poll_interval_spin.set_range(MIN_POLL_INTERVAL, MAX_POLL_INTERVAL)
+        self.poll_interval_spin.set_increments(5, 60)
+        self.poll_interval_spin.set_numeric(True)
+        self.attach(Gtk.Label(label="Check interval (seconds):"), 0, row, 1, 1)
+        self.attach(self.poll_interval_spin, 1, row, 1, 1)
+        row += 1
+
         # === Separator: logs -> sender override ===
         separator_01 = Gtk.Separator(orientation=Gtk.Orientation.HORIZONTAL)
         separator_01.set_margin_top(5)
@@ -116,8 +135,8 @@ class SettingsTab(Gtk.Grid):
 
         # Day of week selector
         self.weekday_combo = Gtk.ComboBoxText()
-        for i in range(7):
-            self.weekday_combo.append_text(calendar.day_name[i])
+        for name in DAY_NAMES:
+            self.weekday_combo.append_text(name)
         self.weekday_combo.set_active(0)
         self.attach(Gtk.Label(label="Day of the week:"), 0, row, 1, 1)
         self.attach(self.weekday_combo, 1, row, 1, 1)
@@ -154,6 +173,11 @@ class SettingsTab(Gtk.Grid):
         settings = load_settings()
 
         self.logs_checkbox.set_active(settings.get("enable_logs", False))
+        self.poll_interval_spin.set_value(
+            settings.get(
+                "poll_interval_seconds", DEFAULT_SETTINGS["poll_interval_seconds"]
+            )
+        )
         self.start_monitoring_checkbox.set_active(
             settings.get("send_monitoring_on_start", False)
         )
@@ -173,7 +197,7 @@ class SettingsTab(Gtk.Grid):
     def on_save_clicked(self, button):
         """
         Save settings after validating input fields.
-        Prevents privilege elevation if validation fails.
+        Prevents privilege elevation if validation fails or nothing changed.
         """
 
         self.main_window.log("-------------------------------------------")
@@ -185,14 +209,31 @@ class SettingsTab(Gtk.Grid):
             self.main_window.log("❌ Invalid settings. Please fix errors.", e)
             return
 
-        def worker():
-            try:
-                save_settings_with_privileges(settings, self.main_window)
-                GLib.idle_add(self.main_window.log, "✅ Settings saved successfully.")
-            except Exception as e:
-                GLib.idle_add(self.main_window.log, "❌ Failed to save settings.", e)
+        if settings_unchanged(settings):
+            self.main_window.log("ℹ️ No changes to save.")
+            return
 
-        threading.Thread(target=worker, daemon=True).start()
+        if self.save_future and not self.save_future.done():
+            self.main_window.log("⏳ Save already in progress.")
+            return
+
+        self.save_future = self.save_executor.submit(
+            save_settings_with_privileges, settings, self.main_window
+        )
+        self.save_future.add_done_callback(self.on_save_done)
+
+    def on_save_done(self, future):
+        """
+        Report the outcome of a save (called from the save worker thread).
+
+        Args:
+            future (concurrent.futures.Future): The completed save.
+        """
+        error = future.exception()
+        if error is None:
+            GLib.idle_add(self.main_window.log, "✅ Settings saved successfully.")
+        else:
+            GLib.idle_add(self.main_window.log, "❌ Failed to save settings.", error)
 
     def build_setting(self):
         """
@@ -206,6 +247,7 @@ class SettingsTab(Gtk.Grid):
         """
         settings = {
             "enable_logs": self.logs_checkbox.get_active(),
+            "poll_interval_seconds": self.poll_interval_spin.get_value_as_int(),
             "send_monitoring_on_start": self.start_monitoring_checkbox.get_active(),
             "monitoring_sender": self.monitoring_sender_entry.get_text().strip(),
             "monitoring_at_30": self.at_30_checkbox.get_active(),
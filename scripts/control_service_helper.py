@@ -6,39 +6,65 @@
 # This script is used to start, stop, or restart the background systemd
 # service 'inactivity-monitor' with elevated privileges (via pkexec).
 # It is designed to be called from the GTK UI for safe privilege escalation.
+# Several commands can be given at once (e.g. `reset-flags restart`) so
+# they only cost a single pkexec authorization; they run in order.
 # --------------------------------------------------------------------
 
 import sys
 import subprocess
 import os
+from shutil import which
 
 # Add project root to sys.path to allow local imports if needed
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Validate number of arguments
-if len(sys.argv) != 2:
-    print("Usage: control_service_helper.py <start|stop|restart>")
+if len(sys.argv) < 2:
+    print("Usage: control_service_helper.py <start|stop|restart|reset-flags>...")
     sys.exit(1)
 
-command = sys.argv[1]
+commands = sys.argv[1:]
 service = "inactivity-monitor"
 
-# Validate the command argument
-if command not in ["start", "stop", "restart"]:
-    print("Invalid command. Use start, stop, or restart.")
-    sys.exit(1)
+# Absolute path of systemctl, resolved once rather than on every spawn
+SYSTEMCTL = which("systemctl") or "/usr/bin/systemctl"
 
-try:
-    """
-    Run the appropriate systemctl command.
-    If successful, display a confirmation message.
-    """
-    subprocess.run(["systemctl", command, service], check=True)
-    print(f"✅ Service '{service}' {command}ed successfully.")
-except subprocess.CalledProcessError as e:
-    """
-    Handle failure when the systemctl command returns a non-zero status.
-    """
-    print(f"❌ Failed to {command} service: {e}")
-    sys.exit(1)
+# Full systemctl argv for each supported command
+SYSTEMCTL_ARGV = {
+    "start": (SYSTEMCTL, "start", service),
+    "stop": (SYSTEMCTL, "stop", service),
+    "restart": (SYSTEMCTL, "restart", service),
+}
+
+# Validate every command before running any of them
+for command in commands:
+    if command not in SYSTEMCTL_ARGV and command != "reset-flags":
+        print("Invalid command. Use start, stop, restart, or reset-flags.")
+        sys.exit(1)
+
+for command in commands:
+    if command == "reset-flags":
+        """
+        Clear the monitoring flags stored in the state file.
+        """
+        from core.state_manager import reset_monitoring_flags
+
+        reset_monitoring_flags()
+        print("✅ Monitoring flags reset.")
+        continue
+
+    try:
+        """
+        Run the appropriate systemctl command.
+        If successful, display a confirmation message.
+        """
+        subprocess.run(SYSTEMCTL_ARGV[command], check=True)
+        print(f"✅ Service '{service}' {command}ed successfully.")
+    except subprocess.CalledProcessError as e:
+        """
+        Handle failure when the systemctl command returns a non-zero status.
+        """
+        print(f"❌ Failed to {command} service: {e}")
+        sys.exit(1)
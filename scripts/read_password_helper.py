@@ -13,19 +13,30 @@ import os
 
 # Add project root to sys.path to allow local imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-import json
+import re
 from core.paths import CONFIG_PATH
 from core.crypto_utils import decrypt_password
 
+# The stored password is a Fernet token (URL-safe base64): it never contains
+# quotes or escapes, so it can be picked straight from the raw file
+SMTP_PASS_RE = re.compile(rb'"smtp_pass"\s*:\s*"([A-Za-z0-9_=-]*)"')
+
 try:
-    # Load the configuration file
-    with open(CONFIG_PATH, "r") as f:
-        config = json.load(f)
+    # Read the configuration file
+    with open(CONFIG_PATH, "rb") as f:
+        raw = f.read()
+
+    # Get the encrypted password, parsing the whole JSON only as a fallback
+    match = SMTP_PASS_RE.search(raw)
+    if match:
+        encrypted = match.group(1).decode()
+    else:
+        import json
 
-    # Get the encrypted password
-    encrypted = config["email"]["smtp_pass"]
+        encrypted = json.loads(raw)["email"]["smtp_pass"]
 
     if encrypted:
         # Decrypt and print the password to stdout
@@ -8,23 +8,60 @@
 # It:
 # - Reads JSON input (stdin or file path)
 # - Encrypts the SMTP password if provided
-# - Reuses the existing encrypted password if the input is blank
-# - Writes the final JSON config to the secure path
+# - Reuses the existing encrypted password if the input is blank or unchanged
+# - Skips the write (and service restart) if the config is unchanged
+# - Atomically writes the final JSON config to the secure path
 # --------------------------------------------------------------------
 
 import os
 import sys
-import json
+import hashlib
 
 # Add project root to sys.path to allow local imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+from core import json_utils
 from core.paths import CONFIG_PATH
-from core.crypto_utils import encrypt_password
+from core.utils import atomic_write
+from core.crypto_utils import encrypt_password, decrypt_password
 from core.service_utils import run_service_command
 
 
+def config_digest(config):
+    """
+    Compute a short digest of a configuration, independent of key order.
+
+    Args:
+        config (dict): The configuration to hash.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest of the canonical JSON form.
+    """
+    canonical = json_utils.dumps(config, sort_keys=True)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+def is_same_password(plain_password, encrypted):
+    """
+    Check whether a plaintext password matches an encrypted one.
+
+    Args:
+        plain_password (str): The password entered by the user.
+        encrypted (str | None): The password currently stored in the config.
+
+    Returns:
+        bool: True if both are the same password.
+    """
+    if not encrypted:
+        return False
+    try:
+        return decrypt_password(encrypted) == plain_password
+    except ValueError:
+        return False
+
+
 def main():
     """
     Read configuration JSON from stdin or a file path, encrypt password if needed,
@@ -38,11 +75,10 @@ def main():
         if len(sys.argv) > 1:
             file_path = sys.argv[1]
             print(f"📄 Reading data from file: {file_path}")
-            with open(file_path, "r") as f:
-                data = json.load(f)
+            data = json_utils.load_file(file_path)
         else:
             print("📥 Reading data from stdin...")
-            data = json.load(sys.stdin)
+            data = json_utils.loads(sys.stdin.buffer.read())
 
         print("✅ JSON data successfully read")
 
@@ -52,12 +88,12 @@ def main():
         os.makedirs(target_dir, exist_ok=True)
 
         # Load existing password from config to preserve it if input is blank
+        existing = None
         existing_password = None
         if os.path.exists(CONFIG_PATH):
             print(f"📂 Existing config found at {CONFIG_PATH}")
-            with open(CONFIG_PATH, "r") as f:
-                existing = json.load(f)
-                existing_password = existing["email"].get("smtp_pass", None)
+            existing = json_utils.load_file(CONFIG_PATH)
+            existing_password = existing["email"].get("smtp_pass", None)
         else:
             print("⚠️ No existing config found")
 
@@ -70,16 +106,23 @@ def main():
                     data["email"]["smtp_pass"] = existing_password
                 else:
                     raise ValueError("No previous password found to reuse.")
+            elif is_same_password(plain_password, existing_password):
+                print("🔐 Password unchanged — keeping previous encrypted password")
+                data["email"]["smtp_pass"] = existing_password
             else:
                 print("🔐 Encrypting new password...")
                 data["email"]["smtp_pass"] = encrypt_password(plain_password)
         else:
             print("❌ smtp_pass not found in data")
 
-        # Save final config
+        # Nothing to do if the resulting config is identical to the saved one
+        if existing is not None and config_digest(data) == config_digest(existing):
+            print("ℹ️ Configuration unchanged — nothing to save.")
+            return
+
+        # Save final config (atomically: never leave a half-written file)
         print(f"💾 Saving config to {CONFIG_PATH}...")
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(data, f, indent=4)
+        atomic_write(CONFIG_PATH, json_utils.dumps(data))
 
         print("🔄 Now restart the service.")
 
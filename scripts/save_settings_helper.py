@@ -3,23 +3,50 @@
 # --------------------------------------------------------------------
 # This helper script is invoked with elevated privileges (via pkexec)
 # to safely save user settings in /etc/inactivity-monitor/settings.json.
-# After saving, it automatically restarts the background service.
+# After saving, it automatically restarts the background service
+# (both are skipped when the settings file already has this content).
 # --------------------------------------------------------------------
 
 #!/usr/bin/env python3
 
 import os
 import sys
-import json
 
 # Add project root to sys.path to allow imports from core/
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from core.paths import SETTINGS_PATH
+from core.settings_manager import DEFAULT_SETTINGS, SERVICE_SETTINGS_KEYS
+from core.utils import atomic_write
+from core import json_utils
 from core.service_utils import run_service_command
 
 
+def restart_required(old_payload, settings):
+    """
+    Tell whether the running service must be restarted to apply new settings.
+
+    Args:
+        old_payload (bytes | None): Previous content of the settings file.
+        settings (dict): The settings just saved.
+
+    Returns:
+        bool: True if a setting read by the service changed (or the previous
+              settings are unknown).
+    """
+    if old_payload is None:
+        return True
+    try:
+        old = {**DEFAULT_SETTINGS, **json_utils.loads(old_payload)}
+    except (ValueError, TypeError):
+        return True
+
+    new = {**DEFAULT_SETTINGS, **settings}
+    return any(old.get(key) != new.get(key) for key in SERVICE_SETTINGS_KEYS)
+
+
 def main():
     """
     Main function executed by pkexec to store settings and restart the service.
@@ -39,15 +66,29 @@ def main():
         print(f"📄 Reading settings from: {file_path}")
 
         # Read the settings from the temporary JSON file
-        with open(file_path, "r") as f:
-            settings = json.load(f)
+        settings = json_utils.load_file(file_path)
 
         # Ensure the target directory exists
         os.makedirs(os.path.dirname(SETTINGS_PATH), exist_ok=True)
 
-        # Write the settings to the final location
-        with open(SETTINGS_PATH, "w") as f:
-            json.dump(settings, f, indent=4)
+        # Nothing to write (nor service to restart) if the content is identical
+        payload = json_utils.dumps(settings)
+        try:
+            with open(SETTINGS_PATH, "rb") as f:
+                old_payload = f.read()
+        except FileNotFoundError:
+            old_payload = None
+
+        if old_payload == payload:
+            print("ℹ️ Settings unchanged — nothing to save.")
+            return
+
+        # Write the settings to the final location (atomically)
+        atomic_write(SETTINGS_PATH, payload)
+
+        if not restart_required(old_payload, settings):
+            print("ℹ️ No setting used by the service changed — no restart needed.")
+            return
 
         print("🔄 Now restart the service.")
 
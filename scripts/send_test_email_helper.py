@@ -5,24 +5,50 @@
 # --------------------------------------------------------------------
 # This script:
 # - Loads the application's main configuration and settings
+#   (or uses the unsaved configuration piped on stdin by the GUI)
 # - Sends a test email to verify SMTP functionality
 # - Designed to be called from the UI or CLI using elevated privileges
 # --------------------------------------------------------------------
 
 import os
 import sys
-import json
-import smtplib
 
 # Add project root to sys.path to allow core module imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from core.config_manager import load_config
+from core import json_utils
+from core.config_manager import load_config, validate_config
 from core.settings_manager import load_settings
 from core.email_utils import send_test_email
 
 
+def read_config():
+    """
+    Return the configuration to test: the one piped on stdin, if any,
+    otherwise the saved one.
+
+    A piped configuration without a password uses the stored password
+    (the GUI form leaves it blank to mean "keep current").
+
+    Returns:
+        dict or None: Configuration with a decrypted SMTP password.
+    """
+    raw = b"" if sys.stdin.isatty() else sys.stdin.buffer.read()
+    if not raw.strip():
+        return load_config(True)
+
+    config = json_utils.loads(raw)
+    validate_config(config)
+
+    if not config["email"].get("smtp_pass"):
+        stored = load_config(True)
+        config["email"]["smtp_pass"] = stored["email"]["smtp_pass"] if stored else ""
+
+    return config
+
+
 def main():
     """
     Load config and settings, then send a test email using the SMTP credentials.
@@ -32,7 +58,7 @@ def main():
     """
     try:
         # Load config with SMTP password decryption
-        config = load_config(True)
+        config = read_config()
         settings = load_settings()
 
         # Attempt to send the test email
@@ -8,21 +8,39 @@
 # - Stops when maximum inactivity duration is exceeded
 # --------------------------------------------------------------------
 
-import time
 import logging
+import logging.handlers
 import os
+import queue
+import signal
 import sys
-from datetime import datetime
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import partial
+from types import MappingProxyType
 
-# Add root project path to sys.path for module imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add root project path to sys.path for module imports (once)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from core.paths import LOG_PATH
-from core.utils import log_info
+from core.paths import LOG_PATH, METRICS_PATH
+from core.utils import atomic_write, log_info
 from core.config_manager import load_config, validate_config
-from core.activity_manager import manage_activity_time
-from core.state_manager import load_state, save_state
-from core.settings_manager import load_settings
+from core.activity_manager import (
+    TickContext,
+    get_last_activity_timestamp,
+    manage_activity_time,
+)
+from core.state_manager import (
+    TIMESTAMP_KEYS,
+    flush_state,
+    load_state,
+    queue_state,
+)
+from core.settings_manager import load_settings, is_valid_poll_interval
+from core.system import start_session_watcher
 from core.email_utils import (
     send_weekly_email,
     send_start_reached_email,
@@ -33,18 +51,244 @@ from core.email_utils import (
     send_threshold_90_email,
     send_alert_to_recipient,
     send_alert_to_monitoring,
+    SendContext,
+    send_batch,
 )
 
 # Ensure log directory exists
 os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
 
-# Configure logging for the background service
+# Configure logging for the background service: records are only queued
+# by the threads logging them, a listener thread writes them to the file
+# (rotated at 1 MB, the GUI's log tail follows the rotation)
+LOG_QUEUE = queue.Queue()
+_log_file_handler = logging.handlers.RotatingFileHandler(
+    LOG_PATH, maxBytes=1_000_000, backupCount=5
+)
+_log_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+)
+LOG_LISTENER = logging.handlers.QueueListener(LOG_QUEUE, _log_file_handler)
+LOG_LISTENER.start()
+
 logging.basicConfig(
-    filename=LOG_PATH,
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+    format="%(message)s",  # Only merges the args: the file handler formats
+    handlers=[logging.handlers.QueueHandler(LOG_QUEUE)],
 )
 
+# Intermediate thresholds: (percent of the timeout, key of both the setting
+# enabling it and the state flag recording its email, email sender)
+INTERMEDIATE_THRESHOLDS = (
+    (30, "monitoring_at_30", send_threshold_30_email),
+    (60, "monitoring_at_60", send_threshold_60_email),
+    (90, "monitoring_at_90", send_threshold_90_email),
+)
+
+# Email batches (senders, SendContext) waiting for the worker
+EMAIL_QUEUE = queue.Queue()
+
+# Seconds allowed on shutdown for the worker to send what's still queued
+EMAIL_DRAIN_TIMEOUT = 60
+
+# Default seconds between two loop ticks (when close to a threshold),
+# overridden by the poll_interval_seconds setting
+TICK_INTERVAL = 30
+
+# Longest delay (seconds) between two ticks while far from any threshold
+# (never shorter than the poll interval itself)
+MAX_TICK_INTERVAL = 300
+
+# Set by the signal handlers to wake up the loop and stop it right away
+STOP_EVENT = threading.Event()
+
+
+def request_stop(signum, frame):
+    """
+    Signal handler: ask the monitor loop to stop at the end of its wait.
+
+    Args:
+        signum (int): Number of the signal received.
+        frame (frame): Current stack frame (unused).
+    """
+    STOP_EVENT.set()
+
+
+def email_worker():
+    """
+    Send the queued email batches in the background, in order.
+
+    Runs until a None sentinel is queued, so SMTP latency never delays the
+    monitor loop itself.
+    """
+    while True:
+        batch = EMAIL_QUEUE.get()
+        if batch is None:
+            return
+        send_batch(*batch)
+
+
+def queue_emails(senders, config, settings, state):
+    """
+    Hand notification emails over to the email worker.
+
+    Args:
+        senders (list): Notification functions to call, in order.
+        config (dict): Main application config.
+        settings (dict): Monitoring settings.
+        state (dict): State to report (copied, as the loop keeps updating it).
+    """
+    EMAIL_QUEUE.put((list(senders), SendContext(config, settings, dict(state))))
+
+
+def stop_email_worker(worker):
+    """
+    Let the email worker send what's still queued, then stop it.
+
+    Args:
+        worker (threading.Thread): The running email worker.
+    """
+    EMAIL_QUEUE.put(None)
+    worker.join(EMAIL_DRAIN_TIMEOUT)
+    if worker.is_alive():
+        logging.warning("⚠️ Emails still pending at shutdown were not sent.")
+
+
+def next_weekly_window(now_timestamp, last_sent_ts, weekly_day, weekly_hour):
+    """
+    Compute when the weekly monitoring email can next become due.
+
+    The email is due on `weekly_day` from `weekly_hour` on (local time), at
+    most once per day. Until the returned time the weekly check can be
+    skipped altogether; from then on the full check decides.
+
+    Args:
+        now_timestamp (float): Current POSIX time.
+        last_sent_ts (float): When the weekly email was last sent (0 if never).
+        weekly_day (int): Day of the week (0 = Monday).
+        weekly_hour (int): Hour of the day from which the email is due.
+
+    Returns:
+        float: POSIX time of the next opportunity (now_timestamp if it's now).
+    """
+    start = now_timestamp
+
+    # Never twice the same day: the earliest is the day after the last email
+    if last_sent_ts > 0:
+        next_day = date.fromtimestamp(last_sent_ts) + timedelta(days=1)
+        start = max(start, datetime.combine(next_day, datetime.min.time()).timestamp())
+
+    start_dt = datetime.fromtimestamp(start)
+    days_ahead = (weekly_day - start_dt.weekday()) % 7
+    if days_ahead == 0 and start_dt.hour >= weekly_hour:
+        return start
+
+    window = start_dt.replace(hour=weekly_hour, minute=0, second=0, microsecond=0)
+    return (window + timedelta(days=days_ahead)).timestamp()
+
+
+def next_tick_interval(
+    logged_in, minutes_to_next, seconds_to_weekly, poll_interval=TICK_INTERVAL
+):
+    """
+    Pick the delay before the next tick from how far the next event is.
+
+    Ticks are spaced out (up to MAX_TICK_INTERVAL) only while a user is
+    logged in: the session stays visible meanwhile and the X idle time
+    covers the whole gap, so no activity is missed. Logged out, a short
+    login could start and end between two long ticks, so the regular
+    poll interval is kept. When weekly monitoring is on, the delay doesn't
+    go past the next weekly window so the weekly email isn't sent late.
+
+    Args:
+        logged_in (bool): Whether a user session is active.
+        minutes_to_next (float | None): Minutes of inactivity left before
+                                        the next threshold, None if unknown.
+        seconds_to_weekly (float | None): Seconds before the next weekly
+                                          window, None if weekly is disabled.
+        poll_interval (float): Regular (and shortest) delay between ticks.
+
+    Returns:
+        float: Seconds to wait before the next tick.
+    """
+    if not logged_in or minutes_to_next is None:
+        return poll_interval
+
+    interval = min(MAX_TICK_INTERVAL, minutes_to_next * 60)
+
+    if seconds_to_weekly is not None:
+        interval = min(interval, seconds_to_weekly)
+
+    return max(poll_interval, interval)
+
+
+def write_metrics(state, threshold, now_timestamp):
+    """
+    Rewrite the metrics file with the current inactivity figures.
+
+    The file is in the Prometheus text exposition format and is replaced
+    atomically, so a scraper never reads a partial file. It lives on a
+    tmpfs (/run), hence no fsync.
+
+    Args:
+        state (dict): State after the tick.
+        threshold (float): Final inactivity threshold, in minutes.
+        now_timestamp (float): Current POSIX time.
+
+    Raises:
+        OSError: If the file can't be written.
+    """
+    last_activity = get_last_activity_timestamp(state)
+    inactivity = (now_timestamp - last_activity) / 60 if last_activity > 0 else 0
+
+    metrics = {
+        "inactivity_monitor_inactivity_minutes": inactivity,
+        "inactivity_monitor_threshold_minutes": threshold,
+        "inactivity_monitor_last_activity_timestamp_seconds": last_activity,
+        "inactivity_monitor_last_weekly_sent_timestamp_seconds": state.get(
+            "last_weekly_monitoring_sent", 0
+        ),
+        "inactivity_monitor_threshold_reached": int(
+            bool(state.get("threshold_reached"))
+        ),
+    }
+    payload = "".join(
+        f"# TYPE {name} gauge\n{name} {value}\n" for name, value in metrics.items()
+    )
+
+    os.makedirs(os.path.dirname(METRICS_PATH), exist_ok=True)
+    atomic_write(METRICS_PATH, payload.encode(), fsync=False)
+
+
+def wait_next_tick(deadline, interval, enable_logs):
+    """
+    Wait until the next tick deadline, or until a stop is requested.
+
+    Ticks are scheduled on a fixed monotonic cadence, so the time spent in
+    the loop body (state I/O, emails) doesn't make the interval drift. If
+    the body overran one or more whole intervals, the missed ticks are
+    skipped instead of being run back to back.
+
+    Args:
+        deadline (float): time.monotonic() value the tick was due at.
+        interval (float): Seconds between this tick and the next one.
+        enable_logs (bool): Whether to log the skipped ticks.
+
+    Returns:
+        float | None: Deadline of the next tick, or None if a stop was requested.
+    """
+    deadline += interval
+    now = time.monotonic()
+
+    if now > deadline:
+        missed = int((now - deadline) // interval) + 1
+        log_info(enable_logs, "⏱️ Tick overran, skipping", missed, "tick(s).")
+        deadline += missed * interval
+
+    if STOP_EVENT.wait(deadline - now):
+        return None
+    return deadline
+
 
 def main():
     """
@@ -57,21 +301,27 @@ def main():
     log_info(True, "########## Starting service #########")
 
     # Log diagnostic environment values
-    log_info(True, f"📡 DISPLAY={os.environ.get('DISPLAY', '<not set>')}")
-    log_info(True, f"📡 XAUTHORITY={os.environ.get('XAUTHORITY', '<not set>')}")
+    log_info(True, "📡 DISPLAY:", os.environ.get("DISPLAY", "<not set>"))
+    log_info(True, "📡 XAUTHORITY:", os.environ.get("XAUTHORITY", "<not set>"))
     log_info(True, "📡 Run Inactivity Monitor.")
 
-    # Load settings from disk
-    settings = load_settings()
+    # Load settings from disk (read-only: shared as is with the email worker)
+    settings = MappingProxyType(load_settings())
     send_monitoring_on_start = settings["send_monitoring_on_start"]
-    monitoring_at_30 = settings["monitoring_at_30"]
-    monitoring_at_60 = settings["monitoring_at_60"]
-    monitoring_at_90 = settings["monitoring_at_90"]
     monitoring_weekly_enabled = settings["monitoring_weekly_enabled"]
     monitoring_weekly_day = settings["monitoring_weekly_day"]
     monitoring_weekly_hour = settings["monitoring_weekly_hour"]
     enable_logs = settings["enable_logs"]
 
+    poll_interval = settings["poll_interval_seconds"]
+    if not is_valid_poll_interval(poll_interval):
+        logging.warning(
+            "⚠️ Invalid poll_interval_seconds %r, using %s.",
+            poll_interval,
+            TICK_INTERVAL,
+        )
+        poll_interval = TICK_INTERVAL
+
     # Load state flags and previous timestamps
     state = load_state()
     if not state:
@@ -90,14 +340,17 @@ def main():
     try:
         validate_config(config)
     except Exception as e:
-        logging.error(f"🔴 Invalid configuration: {e}")
+        logging.error("🔴 Invalid configuration: %s", e)
         return
 
+    # Validated once; read-only from here on, so the email worker can share it
+    config = MappingProxyType(config)
+
     # Handle initial state (e.g., if service is disabled or already expired)
     if threshold_reached:
         log_info(enable_logs, "☠️ Service started but threshold already reached.")
         if send_monitoring_on_start:
-            send_start_reached_email(config, settings, state)
+            queue_emails([send_start_reached_email], config, settings, state)
         else:
             log_info(
                 enable_logs, "🔒 Monitoring email for service startup is disabled."
@@ -108,7 +361,7 @@ def main():
     if service_disabled:
         log_info(enable_logs, "Service started but is disabled.")
         if send_monitoring_on_start:
-            send_start_disabled_email(config, settings, state)
+            queue_emails([send_start_disabled_email], config, settings, state)
         else:
             log_info(
                 enable_logs, "🔒 Monitoring email for service startup is disabled."
@@ -117,66 +370,101 @@ def main():
 
     log_info(enable_logs, "🟢 Service started and is active.")
     if send_monitoring_on_start:
-        send_start_email(config, settings, state)
+        queue_emails([send_start_email], config, settings, state)
     else:
         log_info(enable_logs, "🔒 Monitoring email for service startup is disabled.")
 
     # Default threshold (30 days in minutes)
     threshold = config.get("timeout_minutes", 4320)
 
+    # Catch logins as they happen, even ones shorter than a tick
+    if start_session_watcher():
+        log_info(enable_logs, "👀 Watching logind for new sessions.")
+
+    # Intermediate thresholds as (label, state/settings key, limit in minutes,
+    # enabled, sender), computed once rather than every tick
+    thresholds = [
+        (f"{percent}%", key, threshold * percent / 100, settings[key], send)
+        for percent, key, send in INTERMEDIATE_THRESHOLDS
+    ]
+
+    # No intermediate email enabled: nothing to check (nor log) on each tick
+    if not any(enabled for _, _, _, enabled, _ in thresholds):
+        thresholds = []
+
+    # Time from which the weekly email may be due (checked in full from then)
+    next_weekly_ts = next_weekly_window(
+        time.time(),
+        state.get("last_weekly_monitoring_sent", 0),
+        monitoring_weekly_day,
+        monitoring_weekly_hour,
+    )
+
     # Loop forever (until threshold is hit or service stopped)
+    deadline = time.monotonic()
     while True:
         try:
             log_info(enable_logs, "------------- Loop tick -------------")
 
-            now = datetime.now()
-            now_timestamp = now.timestamp()
+            # Stored timestamps are POSIX seconds: compare them with time.time()
+            now_timestamp = time.time()
 
             state_for_loop = load_state()
+            state_snapshot = dict(state_for_loop)
+            tick = TickContext.capture(enable_logs)
             state_updated_with_time = manage_activity_time(
-                state_for_loop, now, enable_logs
+                state_for_loop, tick, log=partial(log_info, enable_logs)
             )
 
-            last_activity_timestamp = max(
-                state_updated_with_time["last_input_timestamp"],
-                state_updated_with_time["last_login_timestamp"],
+            last_activity_timestamp = get_last_activity_timestamp(
+                state_updated_with_time
             )
 
-            if monitoring_weekly_enabled:
+            # Emails due this tick, handed to the email worker at the end of it
+            pending = []
+
+            # Minutes of inactivity left before the next threshold, if known
+            minutes_to_next = None
 
+            # Full check only once the next weekly window may have opened
+            if monitoring_weekly_enabled and now_timestamp >= next_weekly_ts:
+
+                # Local calendar time, only needed for the weekly schedule
+                now = datetime.fromtimestamp(now_timestamp)
                 now_day = now.weekday()
                 now_hour = now.hour
                 now_date = now.date()
 
                 log_info(
                     enable_logs,
-                    f"📅 [Weekly monitoring] monitoring_weekly_day : {monitoring_weekly_day}",
+                    "📅 [Weekly monitoring] monitoring_weekly_day :",
+                    monitoring_weekly_day,
                 )
                 log_info(
                     enable_logs,
-                    f"📅 [Weekly monitoring] monitoring_weekly_hour : {monitoring_weekly_hour}",
+                    "📅 [Weekly monitoring] monitoring_weekly_hour :",
+                    monitoring_weekly_hour,
                 )
-                log_info(enable_logs, f"📅 [Weekly monitoring] now_day : {now_day}")
-                log_info(enable_logs, f"📅 [Weekly monitoring] now_hour : {now_hour}")
-                log_info(enable_logs, f"📅 [Weekly monitoring] now_date : {now_date}")
+                log_info(enable_logs, "📅 [Weekly monitoring] now_day :", now_day)
+                log_info(enable_logs, "📅 [Weekly monitoring] now_hour :", now_hour)
+                log_info(enable_logs, "📅 [Weekly monitoring] now_date :", now_date)
 
                 last_sent_ts = state_updated_with_time.get(
                     "last_weekly_monitoring_sent", 0
                 )
 
                 log_info(
-                    enable_logs, f"📅 [Weekly monitoring] last_sent_ts : {last_sent_ts}"
+                    enable_logs, "📅 [Weekly monitoring] last_sent_ts :", last_sent_ts
                 )
 
                 last_sent_date = (
-                    datetime.fromtimestamp(last_sent_ts).date()
-                    if last_sent_ts > 0
-                    else None
+                    date.fromtimestamp(last_sent_ts) if last_sent_ts > 0 else None
                 )
 
                 log_info(
                     enable_logs,
-                    f"📅 [Weekly monitoring] last_sent_date : {last_sent_date}",
+                    "📅 [Weekly monitoring] last_sent_date :",
+                    last_sent_date,
                 )
 
                 # Conditions to send the email
@@ -187,110 +475,125 @@ def main():
                 )
 
                 log_info(
-                    enable_logs, f"📅 [Weekly monitoring] should_send : {should_send}"
+                    enable_logs, "📅 [Weekly monitoring] should_send :", should_send
                 )
 
                 if should_send:
-                    try:
-                        log_info(
-                            enable_logs,
-                            "📬 [Weekly monitoring] Weekly monitoring email is due.",
-                        )
-                        send_weekly_email(config, settings, state_for_loop)
-                        state_updated_with_time["last_weekly_monitoring_sent"] = (
-                            now_timestamp
-                        )
-                        log_info(
-                            enable_logs,
-                            "✅ [Weekly monitoring] Weekly monitoring email sent.",
-                        )
-                    except Exception as e:
-                        logging.error(
-                            f"❌ [Weekly monitoring] Failed to send weekly monitoring email: {e}"
-                        )
+                    log_info(
+                        enable_logs,
+                        "📬 [Weekly monitoring] Weekly monitoring email is due.",
+                    )
+                    pending.append(send_weekly_email)
+                    state_updated_with_time["last_weekly_monitoring_sent"] = (
+                        now_timestamp
+                    )
+                    last_sent_ts = now_timestamp
                 else:
                     log_info(
                         enable_logs,
                         "📅 [Weekly monitoring] Weekly monitoring not due yet or already sent today.",
                     )
+
+                next_weekly_ts = next_weekly_window(
+                    now_timestamp,
+                    last_sent_ts,
+                    monitoring_weekly_day,
+                    monitoring_weekly_hour,
+                )
+            elif monitoring_weekly_enabled:
+                log_info(
+                    enable_logs,
+                    "📅 [Weekly monitoring] Weekly monitoring not due yet or already sent today.",
+                )
             else:
                 log_info(
                     enable_logs,
                     "📅 [Weekly monitoring] Weekly monitoring setting disabled.",
                 )
 
-            if last_activity_timestamp > 0:
-                diff_ts_seconds = now_timestamp - last_activity_timestamp
+            diff_ts_seconds = now_timestamp - last_activity_timestamp
+
+            # Activity "in the future": the clock was stepped back (NTP, RTC).
+            # Left alone, every threshold would look unreached and its flag
+            # be cleared, so its email would be sent a second time later.
+            if last_activity_timestamp > 0 and diff_ts_seconds < 0:
+                log_info(
+                    enable_logs,
+                    "🌀 Time anomaly: last activity is",
+                    -diff_ts_seconds,
+                    "s in the future, skipping threshold checks.",
+                )
+            elif last_activity_timestamp > 0:
                 diff_ts_minutes = diff_ts_seconds / 60
-                log_info(enable_logs, f"🕒 Inactivity (m): {diff_ts_minutes}")
-
-                # === 30% Threshold
-                if monitoring_at_30:
-                    threshold__30 = threshold * 0.3
-                    if diff_ts_minutes >= threshold__30:
-                        log_info(enable_logs, "📊 30% threshold reached.")
-                        if not state_updated_with_time.get("monitoring_at_30"):
-                            send_threshold_30_email(config, settings, state_for_loop)
-                            state_updated_with_time["monitoring_at_30"] = True
-                        else:
-                            log_info(enable_logs, "📊 30% email already sent.")
-                    else:
-                        log_info(enable_logs, "📊 Below the 30% threshold.")
-                        state_updated_with_time["monitoring_at_30"] = False
-                else:
-                    log_info(enable_logs, "📊 30% threshold email disabled.")
-
-                # === 60% Threshold
-                if monitoring_at_60:
-                    threshold__60 = threshold * 0.6
-                    if diff_ts_minutes >= threshold__60:
-                        log_info(enable_logs, "📊 60% threshold reached.")
-                        if not state_updated_with_time.get("monitoring_at_60"):
-                            send_threshold_60_email(config, settings, state_for_loop)
-                            state_updated_with_time["monitoring_at_60"] = True
-                        else:
-                            log_info(enable_logs, "📊 60% email already sent.")
-                    else:
-                        log_info(enable_logs, "📊 Below the 60% threshold.")
-                        state_updated_with_time["monitoring_at_60"] = False
-                else:
-                    log_info(enable_logs, "📊 60% threshold email disabled.")
-
-                # === 90% Threshold
-                if monitoring_at_90:
-                    threshold__90 = threshold * 0.9
-                    if diff_ts_minutes >= threshold__90:
-                        log_info(enable_logs, "📊 90% threshold reached.")
-                        if not state_updated_with_time.get("monitoring_at_90"):
-                            send_threshold_90_email(config, settings, state_for_loop)
-                            state_updated_with_time["monitoring_at_90"] = True
+                log_info(enable_logs, "🕒 Inactivity (m):", diff_ts_minutes)
+
+                # === Intermediate thresholds (30/60/90%)
+                if not thresholds:
+                    log_info(enable_logs, "📊 Intermediate threshold emails disabled.")
+
+                for label, key, limit, enabled, send in thresholds:
+                    if not enabled:
+                        log_info(enable_logs, "📊", label, "threshold email disabled.")
+                    elif diff_ts_minutes >= limit:
+                        log_info(enable_logs, "📊", label, "threshold reached.")
+                        if not state_updated_with_time.get(key):
+                            pending.append(send)
+                            state_updated_with_time[key] = True
                         else:
-                            log_info(enable_logs, "📊 90% email already sent.")
+                            log_info(enable_logs, "📊", label, "email already sent.")
                     else:
-                        log_info(enable_logs, "📊 Below the 90% threshold.")
-                        state_updated_with_time["monitoring_at_90"] = False
-                else:
-                    log_info(enable_logs, "📊 90% threshold email disabled.")
+                        log_info(enable_logs, "📊 Below the", label, "threshold.")
+                        state_updated_with_time[key] = False
 
                 # === Final threshold
                 log_info(
                     enable_logs,
-                    f"🧪 Threshold check: {diff_ts_minutes} > {threshold} ?",
+                    "🧪 Threshold check:",
+                    diff_ts_minutes,
+                    ">",
+                    threshold,
+                    "?",
                 )
                 if diff_ts_minutes >= threshold:
                     logging.warning("☠️ Inactivity threshold reached!")
 
-                    send_alert_to_recipient(config, settings, state_for_loop)
-                    send_alert_to_monitoring(config, settings, state_for_loop)
+                    pending.append(send_alert_to_recipient)
+                    pending.append(send_alert_to_monitoring)
 
                     state_updated_with_time["threshold_reached"] = True
                 else:
                     log_info(enable_logs, "🟢 Final threshold NOT reached")
+
+                upcoming = [
+                    limit
+                    for _, _, limit, enabled, _ in thresholds
+                    if enabled and limit > diff_ts_minutes
+                ]
+                minutes_to_next = min(upcoming, default=threshold) - diff_ts_minutes
             else:
                 log_info(enable_logs, "⚠️ No usable activity timestamps found")
 
-            # Save the state
-            save_state(state_updated_with_time)
+            # Sent in the background, over one SMTP connection
+            if pending:
+                queue_emails(pending, config, settings, state_updated_with_time)
+
+            try:
+                write_metrics(state_updated_with_time, threshold, now_timestamp)
+            except OSError as e:
+                log_info(enable_logs, "⚠️ Unable to write metrics:", e)
+
+            # Save the state only if something changed during this tick:
+            # activity timestamps change on almost every tick and are only
+            # persisted periodically, any other change is written at once
+            if state_updated_with_time != state_snapshot:
+                flags_changed = any(
+                    state_updated_with_time.get(key) != state_snapshot.get(key)
+                    for key in state_updated_with_time
+                    if key not in TIMESTAMP_KEYS
+                )
+                queue_state(state_updated_with_time, force=flags_changed)
+            else:
+                log_info(enable_logs, "💾 State unchanged, skipping save.")
 
             if state_updated_with_time.get("threshold_reached"):
                 logging.warning("☠️ STOP Inactivity Monitor because threshold reached")
@@ -298,7 +601,17 @@ def main():
                 break
 
             log_info(enable_logs, "-------------------------------------")
-            time.sleep(30)
+            interval = next_tick_interval(
+                tick.is_logged_in,
+                minutes_to_next,
+                (next_weekly_ts - time.time() if monitoring_weekly_enabled else None),
+                poll_interval,
+            )
+            log_info(enable_logs, "⏳ Next tick in (s):", interval)
+            deadline = wait_next_tick(deadline, interval, enable_logs)
+            if deadline is None:
+                logging.info("🛑 Stop requested, leaving the monitor loop.")
+                break
 
         except Exception as e:
             logging.exception("❌ Unexpected error in monitor loop.")
@@ -308,8 +621,19 @@ def main():
 
 # Entry point
 if __name__ == "__main__":
+    # Wake the loop on systemd's SIGTERM (or Ctrl+C / hangup) so it exits
+    # immediately and pending state gets flushed
+    for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+        signal.signal(signum, request_stop)
+
+    worker = threading.Thread(target=email_worker, name="email-worker", daemon=True)
+    worker.start()
     try:
         main()
     except Exception as e:
         logging.exception("Fatal error in monitor:")
         raise
+    finally:
+        stop_email_worker(worker)
+        flush_state()
+        LOG_LISTENER.stop()  # Writes out the records still queued